@@ -0,0 +1,223 @@
+import asyncio
+import httpx
+import logging
+from typing import Dict, TypeVar
+from json import JSONDecodeError
+from .exceptions import OuraPyException
+from .helpers import (
+    CACHE_MODES,
+    DEFAULT_CACHE_TTL,
+    JSON_HEADERS,
+    TTLCache,
+    TokenBucket,
+    build_cached,
+    build_result,
+    cache_key,
+    encode_body,
+    invalidate_resource,
+    json_loads,
+    raise_for_status,
+)
+from .models import Result
+
+T = TypeVar("T")
+
+
+class AsyncRequestManager:
+    def __init__(
+        self,
+        personal_access_token: str,
+        hostname: str,
+        ver: str,
+        path: str,
+        ssl_verify: bool = True,
+        logger: logging.Logger = None,
+        http2: bool = True,
+        rate_limit: int | None = None,
+        cache_maxsize: int = 256,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_mode: str = "enabled",
+    ) -> None:
+        """Asynchronous HTTP request manager.
+
+        Requests share a single ``httpx.AsyncClient``. With HTTP/2 concurrent
+        calls are multiplexed as streams over one connection, so the pool is
+        kept small. Successful GET responses for personal info and ring
+        configuration are cached; summaries always go to the network.
+
+        Args:
+            personal_access_token (str): The personal access token for authenticating with the Oura API.
+            hostname (str): The API hostname.
+            ver (str): The API version.
+            path (str): The API path.
+            ssl_verify (bool, optional): Whether to verify SSL certificates. Defaults to True.
+            logger (logging.Logger, optional): Logger instance for logging. Defaults to None.
+            http2 (bool, optional): Whether to negotiate HTTP/2. Defaults to True.
+            rate_limit (int, optional): Maximum requests per minute to send. Defaults to None, which does not throttle.
+            cache_maxsize (int, optional): Maximum number of cached GET responses, 0 disables caching. Defaults to 256.
+            cache_ttl (float, optional): Lifetime in seconds of cached responses, 0 disables caching. Defaults to 3600.
+            cache_mode (str, optional): "enabled" to read and store, "read-only" to serve existing entries without storing new ones,
+                "replay" to serve only cached responses and never touch the network, or "disabled". Defaults to "enabled".
+
+        Raises:
+            ValueError: If cache_mode is not a supported mode.
+        """
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(
+                f"cache_mode must be one of {', '.join(CACHE_MODES)}, got {cache_mode!r}"
+            )
+        self._url = f"https://{hostname}/{ver}/{path}"
+        self._url_prefix = f"{self._url}/"
+        self._logger = logger or logging.getLogger(__name__)
+        self._client = httpx.AsyncClient(
+            base_url=self._url,
+            headers={"Authorization": f"Bearer {personal_access_token}"},
+            verify=ssl_verify,
+            http2=http2,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        )
+        self._bucket = TokenBucket(rate_limit) if rate_limit else None
+        self._cache = TTLCache(maxsize=cache_maxsize)
+        self._cache_ttl = cache_ttl
+        self._cache_mode = cache_mode
+
+    async def aclose(self) -> None:
+        """Closes the underlying client and releases its connections."""
+        await self._client.aclose()
+
+    def clear_cache(self) -> None:
+        """Discards every cached response."""
+        self._cache.clear()
+
+    async def get(self, endpoint: str, params: Dict = None) -> Result:
+        """Sends a GET request to the specified endpoint with optional parameters.
+
+        Args:
+            endpoint (str): The API endpoint to send the GET request to.
+            params (Dict, optional): A dictionary of query parameters to include in the request. Defaults to None.
+
+        Returns:
+            Result: The result of the GET request.
+        """
+        return await self._request(method="GET", endpoint=endpoint, params=params)
+
+    async def get_typed(self, endpoint: str, model: type[T], params: Dict = None) -> T:
+        """Sends a GET request and decodes the response straight into a model.
+
+        Unlike get, no intermediate Result is built; the parsed JSON is handed
+        to the model constructor once.
+
+        Args:
+            endpoint (str): The API endpoint to send the GET request to.
+            model (type): The model class to construct from the response body.
+            params (Dict, optional): A dictionary of query parameters to include in the request. Defaults to None.
+
+        Returns:
+            T: An instance of model built from the response data.
+        """
+        return await self._request(
+            method="GET", endpoint=endpoint, params=params, model=model
+        )
+
+    async def post(
+        self, endpoint: str, params: Dict = None, data: Dict = None
+    ) -> Result:
+        """
+        Sends a POST request to the specified endpoint with the given parameters and data.
+
+        Args:
+            endpoint (str): The API endpoint to send the request to.
+            params (Dict, optional): The query parameters to include in the request. Defaults to None.
+            data (Dict | str | bytes, optional): The JSON body of the request, either an object to serialize or
+                already-encoded JSON as str, bytes, bytearray or memoryview sent as is. Defaults to None.
+
+        Returns:
+            Result: The result of the POST request.
+        """
+        return await self._request(
+            method="POST", endpoint=endpoint, params=params, data=data
+        )
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict = None,
+        data: Dict = None,
+        model: type = None,
+    ) -> Result:
+        """
+        Makes an HTTP request to the specified endpoint with the given method, parameters, and data.
+
+        Args:
+            method (str): The HTTP method to use for the request (e.g., 'GET', 'POST').
+            endpoint (str): The API endpoint to send the request to.
+            params (Dict, optional): The query parameters to include in the request. Defaults to None.
+            data (Dict | str | bytes, optional): The request body, serialized to JSON by encode_body. Defaults to None.
+            model (type, optional): Model class to build from the response data instead of a Result. Defaults to None.
+
+        Returns:
+            Result: An object containing the status code, message, and data from the response,
+                or an instance of model when one is given.
+
+        Raises:
+            OuraPyException: If there is an error making the request, if the response contains bad JSON,
+                or if the request would reach the network in replay mode.
+        """
+        url = self._url_prefix + endpoint
+        key = None
+        if method == "GET" and self._cache_mode != "disabled":
+            key = cache_key(endpoint, params)
+            cached = self._cache.get(key) if key is not None else None
+            if cached is not None:
+                self._logger.debug(
+                    "cache hit: method=%s, url=%s, params=%s", method, url, params
+                )
+                return build_cached(cached, model=model)
+        if self._cache_mode == "replay":
+            raise OuraPyException(
+                f"No cached response for {method} {endpoint} in replay mode"
+            )
+        body = encode_body(data)
+        if self._bucket is not None:
+            wait = self._bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        try:
+            self._logger.debug("method=%s, url=%s, params=%s", method, url, params)
+            response = await self._client.request(
+                method=method,
+                url=endpoint,
+                params=params,
+                content=body,
+                headers=JSON_HEADERS if body is not None else None,
+            )
+        except httpx.HTTPError as e:
+            self._logger.error("%s", e)
+            raise OuraPyException("Error making request") from e
+        if not 200 <= response.status_code < 300:
+            raise_for_status(
+                response.status_code,
+                response.reason_phrase,
+                response.headers,
+                self._logger,
+            )
+        if method == "POST" and self._cache_mode == "enabled":
+            invalidate_resource(self._cache, endpoint)
+        try:
+            data_out = json_loads(response.content)
+        except (ValueError, JSONDecodeError) as e:
+            self._logger.error("success=%s, status_code=%s, message=%s", False, None, e)
+            raise OuraPyException("Bad JSON in response") from e
+        self._logger.debug(
+            "success=%s, status_code=%s, message=%s",
+            True,
+            response.status_code,
+            response.reason_phrase,
+        )
+        entry = (response.status_code, response.reason_phrase, response.content)
+        if key is not None and self._cache_mode == "enabled":
+            self._cache.set(key, entry, ttl=self._cache_ttl)
+        return build_result(
+            response.status_code, response.reason_phrase, data_out, model=model
+        )
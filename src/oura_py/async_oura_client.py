@@ -0,0 +1,281 @@
+import asyncio
+import logging
+from datetime import date
+from collections.abc import AsyncIterator
+from .async_helpers import AsyncRequestManager
+from .helpers import DEFAULT_CACHE_TTL, endpoint_path, prep_dates
+from .models import (
+    SUMMARY_SPEC,
+    Result,
+    PersonalInfo,
+    RingConfig,
+    RingConfigData,
+    SleepSummary,
+    SleepSummaryDatum,
+    StressSummary,
+    StressDatum,
+    ReadinessSummary,
+    ReadinessSummaryDatum,
+    ActivitySummary,
+    ActivitySummaryDatum,
+    HeartRateSummary,
+    HeartRateDatum,
+    summary_spec,
+)
+
+
+class AsyncOuraClient:
+    def __init__(
+        self,
+        personal_access_token: str,
+        hostname: str = "api.ouraring.com",
+        ver: str = "v2",
+        path: str = "usercollection",
+        ssl_verify: bool = True,
+        logger: logging.Logger = None,
+        http2: bool = True,
+        rate_limit: int | None = None,
+        cache_maxsize: int = 256,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_mode: str = "enabled",
+    ):
+        """Initializes the AsyncOuraClient instance.
+
+        The coroutine methods mirror OuraClient, so independent requests can be
+        awaited together, e.g.::
+
+            async with AsyncOuraClient(token) as client:
+                sleep, readiness, activity = await asyncio.gather(
+                    client.get_sleep_summary(start, end),
+                    client.get_readiness_summary(start, end),
+                    client.get_activity_summary(start, end),
+                )
+
+        Args:
+            personal_access_token (str): The personal access token for authenticating with the Oura API.
+            hostname (str, optional): The API hostname. Defaults to "api.ouraring.com".
+            ver (str, optional): The API version. Defaults to "v2".
+            path (str, optional): The API path. Defaults to "usercollection".
+            ssl_verify (bool, optional): Whether to verify SSL certificates. Defaults to True.
+            logger (logging.Logger, optional): Logger instance for logging. Defaults to None.
+            http2 (bool, optional): Whether to negotiate HTTP/2 so concurrent requests share one connection. Defaults to True.
+            rate_limit (int, optional): Maximum requests per minute to send, throttling locally instead of hitting 429s. Defaults to None.
+            cache_maxsize (int, optional): Maximum number of cached GET responses, 0 disables caching. Defaults to 256.
+            cache_ttl (float, optional): Lifetime in seconds of cached personal info and ring configuration, 0 disables caching. Defaults to 3600.
+            cache_mode (str, optional): One of "enabled", "read-only", "replay" or "disabled". Defaults to "enabled".
+        """
+        self.url = f"https://{hostname}/{ver}/{path}"
+        self._logger = logger or logging.getLogger(__name__)
+        self._manager = AsyncRequestManager(
+            personal_access_token=personal_access_token,
+            hostname=hostname,
+            ver=ver,
+            path=path,
+            ssl_verify=ssl_verify,
+            logger=self._logger,
+            http2=http2,
+            rate_limit=rate_limit,
+            cache_maxsize=cache_maxsize,
+            cache_ttl=cache_ttl,
+            cache_mode=cache_mode,
+        )
+
+    async def __aenter__(self) -> "AsyncOuraClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP client."""
+        await self._manager.aclose()
+
+    def clear_cache(self) -> None:
+        """Discards every cached response."""
+        self._manager.clear_cache()
+
+    async def get_summary(
+        self,
+        summary_type: str,
+        start: str | None = None,
+        end: str | None = None,
+        next_token: str | None = None,
+    ):
+        """Fetches a summary by type for a date range, or a single document.
+
+        Args:
+            summary_type (str): One of "sleep", "readiness", "activity", "heartrate" or "stress".
+            start (str, optional): Start date in YYYY-MM-DD format. Defaults to the day before end.
+            end (str, optional): End date in YYYY-MM-DD format. Defaults to today.
+            next_token (str, optional): Document ID to fetch a single datum instead of a range. Defaults to None.
+
+        Returns:
+            The summary model for the type, or its datum model when next_token is given.
+
+        Raises:
+            ValueError: If summary_type is not a known summary.
+        """
+        return await self._get_summary_generic(summary_type, start, end, next_token)
+
+    async def get_sleep_summary(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        next_token: str | None = None,
+    ) -> SleepSummary | SleepSummaryDatum:
+        return await self._get_summary_generic("sleep", start, end, next_token)
+
+    async def get_readiness_summary(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        next_token: str | None = None,
+    ) -> ReadinessSummary | ReadinessSummaryDatum:
+        return await self._get_summary_generic("readiness", start, end, next_token)
+
+    async def get_activity_summary(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        next_token: str | None = None,
+    ) -> ActivitySummary | ActivitySummaryDatum:
+        return await self._get_summary_generic("activity", start, end, next_token)
+
+    async def get_heartrate_summary(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        next_token: str | None = None,
+    ) -> HeartRateSummary | HeartRateDatum:
+        return await self._get_summary_generic("heartrate", start, end, next_token)
+
+    async def get_stress_summary(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        next_token: str | None = None,
+    ) -> StressSummary | StressDatum:
+        return await self._get_summary_generic("stress", start, end, next_token)
+
+    async def fetch_all(self, start: str | None = None, end: str | None = None) -> dict:
+        """Fetches every summary type for the date range concurrently.
+
+        Args:
+            start (str, optional): Start date in YYYY-MM-DD format. Defaults to the day before end.
+            end (str, optional): End date in YYYY-MM-DD format. Defaults to today.
+
+        Returns:
+            dict: The summaries keyed by type ("sleep", "readiness", "activity", "heartrate", "stress").
+        """
+        summary_types = list(SUMMARY_SPEC)
+        summaries = await asyncio.gather(
+            *(
+                self._get_summary_generic(summary_type, start, end)
+                for summary_type in summary_types
+            )
+        )
+        return dict(zip(summary_types, summaries))
+
+    async def get_sleep_summaries(
+        self, ranges: list[tuple[str | None, str | None]], max_concurrency: int = 5
+    ) -> list[SleepSummary]:
+        """Fetches sleep summaries for several date ranges concurrently.
+
+        Args:
+            ranges (list[tuple[str, str]]): The (start, end) date pairs in YYYY-MM-DD format.
+            max_concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 5.
+
+        Returns:
+            list[SleepSummary]: One summary per range, in the order given.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(start, end):
+            async with semaphore:
+                return await self._get_summary_generic("sleep", start, end)
+
+        return list(await asyncio.gather(*(fetch(start, end) for start, end in ranges)))
+
+    async def get_daily_summary(self, day: str | None = None) -> dict:
+        """Fetches every summary type for a single day concurrently.
+
+        Args:
+            day (str, optional): The day in YYYY-MM-DD format. Defaults to today.
+
+        Returns:
+            dict: The summaries keyed by type, as returned by fetch_all.
+        """
+        day = day or date.today().isoformat()
+        return await self.fetch_all(day, day)
+
+    async def get_many(self, specs: list[tuple[str, dict | None]]) -> list[Result]:
+        """Sends a GET for each (endpoint, params) pair concurrently.
+
+        Args:
+            specs (list[tuple[str, dict]]): The endpoints to fetch, each with its query parameters or None.
+
+        Returns:
+            list[Result]: One result per spec, in the order given.
+        """
+        return list(
+            await asyncio.gather(
+                *(self._manager.get(endpoint, params) for endpoint, params in specs)
+            )
+        )
+
+    async def get_personal_info(self) -> PersonalInfo:
+        return await self._manager.get_typed("personal_info", PersonalInfo)
+
+    async def get_ring_config(
+        self, document_id: str | None = None
+    ) -> RingConfig | RingConfigData:
+        model = RingConfig if document_id is None else RingConfigData
+        endpoint = endpoint_path("ring_configuration", document_id)
+        return await self._manager.get_typed(endpoint, model)
+
+    async def iter_sleep_summary(
+        self, start: str | None = None, end: str | None = None
+    ) -> AsyncIterator[SleepSummaryDatum]:
+        """Yields every sleep datum in the date range, following next_token pages."""
+        async for datum in self._iter_summary_generic("sleep", start, end):
+            yield datum
+
+    async def _get_summary_generic(
+        self,
+        summary_type: str,
+        start: str | None = None,
+        end: str | None = None,
+        next_token: str | None = None,
+    ):
+        summary_endpoint, data_class, data_class_datum = summary_spec(summary_type)
+        if next_token:
+            self._logger.debug("next_token=%s", next_token)
+            return await self._manager.get_typed(
+                endpoint_path(summary_endpoint, next_token), data_class_datum
+            )
+        start_date, end_date = prep_dates(start, end, logger=self._logger)
+        return await self._manager.get_typed(
+            summary_endpoint,
+            data_class,
+            params={"start_date": start_date, "end_date": end_date},
+        )
+
+    async def _iter_summary_generic(
+        self,
+        summary_type: str,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> AsyncIterator:
+        summary_endpoint, data_class, _ = SUMMARY_SPEC[summary_type]
+        start_date, end_date = prep_dates(start, end, logger=self._logger)
+        params = {"start_date": start_date, "end_date": end_date}
+        while True:
+            page = await self._manager.get_typed(
+                summary_endpoint, data_class, params=params
+            )
+            for datum in page.data:
+                yield datum
+            if not page.next_token:
+                return
+            self._logger.debug("next_token=%s", page.next_token)
+            params = {**params, "next_token": page.next_token}
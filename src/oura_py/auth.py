@@ -1,12 +1,37 @@
 import requests
+from requests.adapters import HTTPAdapter
+from .helpers import json_loads
 
 
 class PersonalTokenRequestHandler:
-    def __init__(self, personal_access_token):
+    def __init__(self, personal_access_token, session: requests.Session = None):
         self.personal_access_token = personal_access_token
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+        self._session = session
+        auth_header = {"Authorization": f"Bearer {self.personal_access_token}"}
+        if self._owns_session:
+            self._session.headers.update(auth_header)
+            self._request_headers = None
+        else:
+            # A caller's session is only borrowed, so authenticate per request.
+            self._request_headers = auth_header
+
+    def __enter__(self) -> "PersonalTokenRequestHandler":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the session if this handler created it."""
+        if self._owns_session:
+            self._session.close()
 
     def make_request(
-        self, url: str, method: str = "GET", params: dict = {}
+        self, url: str, method: str = "GET", params: dict | None = None
     ) -> requests.Response:
         if not url:
             raise TypeError("URL is required")
@@ -14,10 +39,18 @@ class PersonalTokenRequestHandler:
         if method not in ["GET", "POST"]:
             raise ValueError("Method must be 'GET' or 'POST'")
 
-        request_method = requests.post if method == "POST" else requests.get
-        headers = {"Authorization": f"Bearer {self.personal_access_token}"}
+        request_method = self._session.post if method == "POST" else self._session.get
 
-        response = request_method(url, headers=headers, params=params)
+        response = request_method(url, params=params, headers=self._request_headers)
         response.raise_for_status()
 
         return response
+
+    def make_json_request(
+        self, url: str, method: str = "GET", params: dict | None = None
+    ) -> dict | list:
+        """Makes a request and decodes the JSON body straight from its bytes.
+
+        Uses orjson when available, avoiding the response.text round trip.
+        """
+        return json_loads(self.make_request(url, method=method, params=params).content)
@@ -2,3 +2,15 @@ class OuraPyException(Exception):
     """Base class for exceptions in this module."""
 
     pass
+
+
+class OuraPyRateLimitError(OuraPyException):
+    """Raised when the API responds with 429 Too Many Requests.
+
+    Attributes:
+        retry_after: Seconds to wait before retrying, from the Retry-After header, if provided.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
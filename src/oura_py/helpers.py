@@ -1,10 +1,148 @@
 import requests
 import logging
-from typing import Dict
+import threading
+import time
+import urllib3
+from collections import OrderedDict
+from datetime import date, timedelta
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import Dict, TypeVar
 from json import JSONDecodeError
 from urllib3.exceptions import InsecureRequestWarning
-from .exceptions import OuraPyException
-from .models import Result
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from .exceptions import OuraPyException, OuraPyRateLimitError
+from .models import RawResult, Result
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # orjson is an optional speedup, see the "perf" extra
+    import json
+    from json import loads as json_loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+T = TypeVar("T")
+
+# Only effectively static resources are cached; summaries are ranged
+# time-series data that callers expect to be fresh.
+CACHED_RESOURCES = ("personal_info", "ring_configuration")
+DEFAULT_CACHE_TTL = 3600
+
+CACHE_MODES = ("enabled", "read-only", "replay", "disabled")
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+_insecure_warnings_disabled = False
+
+
+class TTLCache:
+    """A small LRU cache whose entries expire after a per-entry time to live.
+
+    Expired entries are kept until evicted so they can still be served as a
+    stale fallback. Access is guarded by a lock so a client can be shared
+    between threads.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, stale: bool = False):
+        """Returns the cached value for key, or None if missing or expired.
+
+        Args:
+            key: The cache key.
+            stale (bool, optional): Whether to return the value even if it has expired. Defaults to False.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if not stale and expires_at < time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float) -> None:
+        """Stores value under key for ttl seconds, evicting the oldest entry when full."""
+        if self._maxsize <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def remove_if(self, predicate) -> None:
+        """Removes every entry whose key satisfies predicate."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class TokenBucket:
+    """A token bucket that spaces requests to stay under a per-minute cap.
+
+    The bucket starts full, so a burst of up to rate requests goes out
+    immediately; after that tokens refill continuously at rate / 60 per
+    second. Reserving a token only holds a short lock, so one bucket can
+    serve both threads and async tasks.
+    """
+
+    def __init__(self, rate: int) -> None:
+        self._capacity = float(rate)
+        self._tokens = float(rate)
+        self._fill_rate = rate / 60.0
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last) * self._fill_rate
+            )
+            self._last = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._fill_rate
+
+    def acquire(self) -> None:
+        """Takes a token, sleeping until it is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _ThrottledRetry(Retry):
+    """A urllib3 Retry that takes a token from bucket before each retried request.
+
+    urllib3 re-sends retries below requests, where RequestManager cannot see
+    them, so the bucket rides along on every copy made by increment.
+    """
+
+    bucket: TokenBucket | None = None
+
+    def new(self, **kw):
+        retry = super().new(**kw)
+        retry.bucket = self.bucket
+        return retry
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        if self.bucket is not None:
+            self.bucket.acquire()
 
 
 class RequestManager:
@@ -16,9 +154,20 @@ class RequestManager:
         path: str,
         ssl_verify: bool = True,
         logger: logging.Logger = None,
+        cache_maxsize: int = 256,
+        cache_fallback: bool = False,
+        max_retries: int = 3,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_mode: str = "enabled",
+        timeout: float | tuple[float, float] | None = (5.0, 10.0),
+        rate_limit: int | None = None,
     ) -> None:
         """HTTP request manager.
 
+        Successful GET responses for personal info and ring configuration are
+        cached in memory; summaries always go to the network. GETs answered with 429 or a 5xx gateway error are
+        retried with exponential backoff, honouring Retry-After.
+
         Args:
             personal_access_token (str): The personal access token for authenticating with the Oura API.
             hostname (str): The API hostname.
@@ -26,42 +175,161 @@ class RequestManager:
             path (str): The API path.
             ssl_verify (bool, optional): Whether to verify SSL certificates. Defaults to True.
             logger (logging.Logger, optional): Logger instance for logging. Defaults to None.
+            cache_maxsize (int, optional): Maximum number of cached GET responses, 0 disables caching. Defaults to 256.
+            cache_fallback (bool, optional): Whether to serve an expired cached response when the request fails. Defaults to False.
+            max_retries (int, optional): Maximum number of retries for transient GET failures, 0 disables retrying. Defaults to 3.
+            cache_ttl (float, optional): Lifetime in seconds of cached responses, 0 disables caching. Defaults to 3600.
+            cache_mode (str, optional): "enabled" to read and store, "read-only" to serve existing entries without storing new ones,
+                "replay" to serve only cached responses and never touch the network, or "disabled". Defaults to "enabled".
+            timeout (float | tuple[float, float], optional): Seconds to wait for the connection and for each read, as a single
+                value or a (connect, read) pair; None waits forever. Defaults to (5.0, 10.0).
+            rate_limit (int, optional): Maximum requests per minute to send, throttling locally instead of running
+                into 429s; every retry takes a token, cache hits do not. Defaults to None, which does not throttle.
+
+        Raises:
+            ValueError: If cache_mode is not a supported mode.
         """
+        if cache_mode not in CACHE_MODES:
+            raise ValueError(
+                f"cache_mode must be one of {', '.join(CACHE_MODES)}, got {cache_mode!r}"
+            )
         self._url = f"https://{hostname}/{ver}/{path}"
-        self._personal_access_token = personal_access_token
-        self._ssl_verify = ssl_verify
+        self._url_prefix = f"{self._url}/"
         self._logger = logger or logging.getLogger(__name__)
         if not ssl_verify:
-            requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
+            _disable_insecure_warnings()
+        self._session = requests.Session()
+        # ACCEPT_ENCODING adds br/zstd only when urllib3 can decode them.
+        self._session.headers.update(
+            {
+                "Authorization": f"Bearer {personal_access_token}",
+                "Accept-Encoding": ACCEPT_ENCODING,
+            }
+        )
+        self._session.verify = ssl_verify
+        self._bucket = TokenBucket(rate_limit) if rate_limit else None
+        retry = _ThrottledRetry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        retry.bucket = self._bucket
+        self._session.mount(
+            "https://",
+            HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=20),
+        )
+        self._cache = TTLCache(maxsize=cache_maxsize)
+        self._cache_fallback = cache_fallback
+        self._cache_ttl = cache_ttl
+        self._cache_mode = cache_mode
+        self._timeout = timeout
+
+    def close(self) -> None:
+        """Closes the underlying session and releases its pooled connections."""
+        self._session.close()
+
+    def clear_cache(self) -> None:
+        """Discards every cached response."""
+        self._cache.clear()
 
-    def get(self, endpoint: str, params: Dict = None) -> Result:
+    def get(self, endpoint: str, params: Dict = None, raw: bool = False) -> Result:
         """Sends a GET request to the specified endpoint with optional parameters.
 
         Args:
             endpoint (str): The API endpoint to send the GET request to.
             params (Dict, optional): A dictionary of query parameters to include in the request. Defaults to None.
+            raw (bool, optional): Whether to skip JSON decoding and return a RawResult. Defaults to False.
 
         Returns:
             Result: The result of the GET request.
         """
-        return self._request(method="GET", endpoint=endpoint, params=params)
+        return self._request(method="GET", endpoint=endpoint, params=params, raw=raw)
+
+    def get_typed(self, endpoint: str, model: type[T], params: Dict = None) -> T:
+        """Sends a GET request and decodes the response straight into a model.
+
+        Unlike get, no intermediate Result is built; the parsed JSON is handed
+        to the model constructor once.
+
+        Args:
+            endpoint (str): The API endpoint to send the GET request to.
+            model (type): The model class to construct from the response body.
+            params (Dict, optional): A dictionary of query parameters to include in the request. Defaults to None.
+
+        Returns:
+            T: An instance of model built from the response data.
+        """
+        return self._request(
+            method="GET", endpoint=endpoint, params=params, model=model
+        )
+
+    def stream_get(self, endpoint: str, params: Dict = None) -> requests.Response:
+        """Sends a GET request whose body is left unread for incremental parsing.
+
+        The caller owns the returned response and must close it.
+
+        Args:
+            endpoint (str): The API endpoint to send the GET request to.
+            params (Dict, optional): A dictionary of query parameters to include in the request. Defaults to None.
+
+        Returns:
+            requests.Response: The streaming response, with transparent content decoding enabled on response.raw.
+
+        Raises:
+            OuraPyException: If there is an error making the request, the response status is not 2xx,
+                or the cache is in replay mode.
+        """
+        url = self._url_prefix + endpoint
+        self._check_not_replay("GET", endpoint)
+        if self._bucket is not None:
+            self._bucket.acquire()
+        try:
+            self._logger.debug("method=%s, url=%s, params=%s", "GET", url, params)
+            response = self._session.get(
+                url, params=params, stream=True, timeout=self._timeout
+            )
+        except requests.exceptions.RequestException as e:
+            self._logger.error("%s", e)
+            raise OuraPyException("Error making request") from e
+        if not 200 <= response.status_code < 300:
+            response.close()
+            raise_for_status(
+                response.status_code, response.reason, response.headers, self._logger
+            )
+        response.raw.decode_content = True
+        return response
 
-    def post(self, endpoint: str, params: Dict = None, data: Dict = None) -> Result:
+    def post(
+        self, endpoint: str, params: Dict = None, data: Dict = None, raw: bool = False
+    ) -> Result:
         """
         Sends a POST request to the specified endpoint with the given parameters and data.
 
         Args:
             endpoint (str): The API endpoint to send the request to.
             params (Dict, optional): The query parameters to include in the request. Defaults to None.
-            data (Dict, optional): The data to include in the body of the request. Defaults to None.
+            data (Dict | str | bytes, optional): The JSON body of the request, either an object to serialize or
+                already-encoded JSON as str, bytes, bytearray or memoryview sent as is. Defaults to None.
+            raw (bool, optional): Whether to skip JSON decoding and return a RawResult. Defaults to False.
 
         Returns:
             Result: The result of the POST request.
         """
-        return self._request(method="POST", endpoint=endpoint, params=params, data=data)
+        return self._request(
+            method="POST", endpoint=endpoint, params=params, data=data, raw=raw
+        )
 
     def _request(
-        self, method: str, endpoint: str, params: Dict = None, data: Dict = None
+        self,
+        method: str,
+        endpoint: str,
+        params: Dict = None,
+        data: Dict = None,
+        model: type = None,
+        raw: bool = False,
     ) -> Result:
         """
         Makes an HTTP request to the specified endpoint with the given method, parameters, and data.
@@ -70,42 +338,238 @@ class RequestManager:
             method (str): The HTTP method to use for the request (e.g., 'GET', 'POST').
             endpoint (str): The API endpoint to send the request to.
             params (Dict, optional): The query parameters to include in the request. Defaults to None.
-            data (Dict, optional): The data to include in the request body. Defaults to None.
+            data (Dict | str | bytes, optional): The request body, serialized to JSON by encode_body. Defaults to None.
+            model (type, optional): Model class to build from the response data instead of a Result. Defaults to None.
+            raw (bool, optional): Whether to skip decoding and caching and return a RawResult. Defaults to False.
 
         Returns:
-            Result: An object containing the status code, message, and data from the response.
+            Result: An object containing the status code, message, and data from the response,
+                or an instance of model when one is given, or a RawResult when raw is set.
 
         Raises:
-            OuraPyException: If there is an error making the request or if the response contains bad JSON.
+            OuraPyException: If there is an error making the request, if the response contains bad JSON,
+                or if the request would reach the network in replay mode.
         """
-        url = f"{self._url}/{endpoint}"
-        headers = {"Authorization": f"Bearer {self._personal_access_token}"}
-        log_pre = f"method={method}, url={url}, params={params}"
-        log_post = ", ".join(("success={}", "status_code={}", "message={}"))
+        url = self._url_prefix + endpoint
+        key = None
+        if method == "GET" and not raw and self._cache_mode != "disabled":
+            key = cache_key(endpoint, params)
+            cached = self._cache.get(key) if key is not None else None
+            if cached is not None:
+                self._logger.debug(
+                    "cache hit: method=%s, url=%s, params=%s", method, url, params
+                )
+                return build_cached(cached, model=model)
+        self._check_not_replay(method, endpoint)
+        body = encode_body(data)
+        if self._bucket is not None:
+            self._bucket.acquire()
         try:
-            self._logger.debug(msg=log_pre)
-            response = requests.request(
+            self._logger.debug("method=%s, url=%s, params=%s", method, url, params)
+            response = self._session.request(
                 method=method,
                 url=url,
-                headers=headers,
                 params=params,
-                data=data,
-                verify=self._ssl_verify,
+                data=body,
+                headers=JSON_HEADERS if body is not None else None,
+                timeout=self._timeout,
             )
         except requests.exceptions.RequestException as e:
-            self._logger.error(msg=str(e))
+            self._logger.error("%s", e)
+            stale = (
+                self._cache.get(key, stale=True)
+                if self._cache_fallback and key is not None
+                else None
+            )
+            if stale is not None:
+                self._logger.warning(
+                    "serving stale cache entry: method=%s, url=%s, params=%s",
+                    method,
+                    url,
+                    params,
+                )
+                return build_cached(stale, model=model)
             raise OuraPyException("Error making request") from e
+        if not 200 <= response.status_code < 300:
+            raise_for_status(
+                response.status_code, response.reason, response.headers, self._logger
+            )
+        if method == "POST" and self._cache_mode == "enabled":
+            invalidate_resource(self._cache, endpoint)
+        if raw:
+            return RawResult(
+                status_code=response.status_code,
+                message=response.reason,
+                content=response.content,
+            )
         try:
-            data_out = response.json()
+            data_out = json_loads(response.content)
         except (ValueError, JSONDecodeError) as e:
-            self._logger.error(msg=log_post.format(False, None, e))
+            self._logger.error("success=%s, status_code=%s, message=%s", False, None, e)
             raise OuraPyException("Bad JSON in response") from e
-        req_success = 299 >= response.status_code >= 200
-        log_line = log_post.format(req_success, response.status_code, response.reason)
-        if req_success:
-            self._logger.debug(msg=log_line)
-            return Result(
-                status_code=response.status_code, message=response.reason, data=data_out
+        self._logger.debug(
+            "success=%s, status_code=%s, message=%s",
+            True,
+            response.status_code,
+            response.reason,
+        )
+        # Cache the undecoded body so every hit gets its own copy of the data.
+        entry = (response.status_code, response.reason, response.content)
+        if key is not None and self._cache_mode == "enabled":
+            self._cache.set(key, entry, ttl=self._cache_ttl)
+        return build_result(
+            response.status_code, response.reason, data_out, model=model
+        )
+
+    def _check_not_replay(self, method: str, endpoint: str) -> None:
+        """Raises instead of reaching the network when the cache is in replay mode."""
+        if self._cache_mode == "replay":
+            raise OuraPyException(
+                f"No cached response for {method} {endpoint} in replay mode"
             )
-        self._logger.error(msg=log_line)
-        raise OuraPyException(f"{response.status_code}: {response.reason}")
+
+
+def _disable_insecure_warnings() -> None:
+    """Silences urllib3's InsecureRequestWarning, once per process."""
+    global _insecure_warnings_disabled
+    if not _insecure_warnings_disabled:
+        urllib3.disable_warnings(InsecureRequestWarning)
+        _insecure_warnings_disabled = True
+
+
+def encode_body(data) -> bytes | None:
+    """Serializes a request body to JSON, passing already-encoded JSON through.
+
+    A str is taken to be encoded JSON and sent as UTF-8. bytearray and
+    memoryview are copied to bytes once, since neither requests nor httpx
+    send them as a raw body.
+
+    Raises:
+        OuraPyException: If data cannot be serialized to JSON.
+    """
+    if data is None or isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode()
+    if isinstance(data, (bytearray, memoryview)):
+        return bytes(data)
+    try:
+        return json_dumps(data)
+    except (TypeError, ValueError) as e:
+        raise OuraPyException("Request body is not JSON serializable") from e
+
+
+def cache_key(endpoint: str, params: Dict | None = None) -> tuple | None:
+    """Returns a hashable cache key for a GET, or None if it is not cached.
+
+    Only CACHED_RESOURCES are cached. List and tuple parameter values, which
+    requests sends as repeated query parameters, are keyed as tuples.
+    """
+    if endpoint.split("/")[0] not in CACHED_RESOURCES:
+        return None
+    items = []
+    for name, value in (params or {}).items():
+        if isinstance(value, (list, tuple)):
+            value = tuple(value)
+        items.append((name, value))
+    key = (endpoint, tuple(sorted(items, key=lambda item: item[0])))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def invalidate_resource(cache: TTLCache, endpoint: str) -> None:
+    """Drops cached GETs of the resource a successful write went to.
+
+    A write may change what the same resource returns to a GET, so this runs
+    as soon as the write succeeds, whatever its body.
+    """
+    resource = endpoint.split("/")[0]
+    cache.remove_if(lambda key: key[0].split("/")[0] == resource)
+
+
+def build_cached(entry: tuple, model: type = None):
+    """Builds a fresh result from a cached (status_code, message, content) entry."""
+    status_code, message, content = entry
+    return build_result(status_code, message, json_loads(content), model=model)
+
+
+def build_result(status_code: int, message: str, data, model: type = None):
+    """Returns an instance of model built from data, or a Result when model is None."""
+    if model is not None:
+        return model.from_dict(data)
+    return Result(status_code=status_code, message=message, data=data)
+
+
+def raise_for_status(
+    status_code: int, reason: str, headers, logger: logging.Logger
+) -> None:
+    """Logs and raises the exception matching a non-2xx response.
+
+    Raises:
+        OuraPyRateLimitError: If the status is 429, carrying the Retry-After hint in seconds.
+        OuraPyException: For any other status.
+    """
+    logger.error("success=%s, status_code=%s, message=%s", False, status_code, reason)
+    if status_code == 429:
+        try:
+            retry_after = float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            retry_after = None
+        raise OuraPyRateLimitError(f"{status_code}: {reason}", retry_after=retry_after)
+    raise OuraPyException(f"{status_code}: {reason}")
+
+
+def endpoint_path(name: str, document_id: str | None = None) -> str:
+    """Returns the collection endpoint, or the single-document path when an ID is given."""
+    return name if document_id is None else f"{name}/{document_id}"
+
+
+def prep_dates(
+    start_date: str | None = None,
+    end_date: str | None = None,
+    logger: logging.Logger = None,
+) -> tuple[str, str]:
+    """Resolves an optional ISO date range, defaulting to the last day.
+
+    Args:
+        start_date (str, optional): Start date in YYYY-MM-DD format. Defaults to the day before end_date.
+        end_date (str, optional): End date in YYYY-MM-DD format. Defaults to today.
+        logger (logging.Logger, optional): Logger instance for logging. Defaults to None.
+
+    Returns:
+        tuple[str, str]: The start and end dates in YYYY-MM-DD format.
+
+    Raises:
+        OuraPyException: If either date is not a valid ISO date or the start date is after the end date.
+    """
+    end = _as_date("end_date", end_date) if end_date else date.today()
+    start = (
+        _as_date("start_date", start_date) if start_date else end - timedelta(days=1)
+    )
+    if start > end:
+        (logger or logging.getLogger(__name__)).error(
+            "Start date must be before end date. Provided start: %s, end: %s",
+            start_date,
+            end_date,
+        )
+        raise OuraPyException("Start date must be before end date.")
+    return start.isoformat(), end.isoformat()
+
+
+def _as_date(name: str, value) -> date:
+    """Validates and parses a date argument, raising OuraPyException for bad input."""
+    if not isinstance(value, str):
+        raise OuraPyException(f"{name} must be a YYYY-MM-DD string, got {value!r}")
+    try:
+        return _parse_iso_date(value)
+    except ValueError:
+        raise OuraPyException(f"{name} is not a valid date: {value!r}") from None
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_date(value: str) -> date:
+    """Parses an ISO 8601 date once per distinct string."""
+    return date.fromisoformat(value)
@@ -1,5 +1,94 @@
+import inspect
+from operator import attrgetter, itemgetter
 from typing import Dict, List
-from datetime import datetime
+from datetime import date, datetime
+
+
+def _parse_datetime(value: str | datetime | None) -> datetime | None:
+    """Parses an ISO 8601 timestamp, passing through non-string values."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _parse_date(value: str | date | None) -> date | None:
+    """Parses an ISO 8601 calendar date, passing through non-string values."""
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+class _Model:
+    """Base for response models that can be built positionally from a dict.
+
+    The constructor's parameter names are captured once per class as an
+    itemgetter, so from_dict skips keyword-argument binding and ignores any
+    keys the model does not declare. Keys the API omits fall back to the
+    constructor's defaults.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_names = tuple(inspect.signature(cls.__init__).parameters)[1:]
+        cls._fields = itemgetter(*cls._field_names)
+
+    @classmethod
+    def from_dict(cls, data: Dict):
+        """Builds an instance from a decoded JSON object, dropping unknown keys."""
+        try:
+            return cls(*cls._fields(data))
+        except KeyError:
+            return cls(
+                **{name: data[name] for name in cls._field_names if name in data}
+            )
+
+
+class _Summary(_Model):
+    """Base for paged responses holding a list of models in data."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_models(cls, data: List, next_token: str | None = None):
+        """Builds a summary around already constructed datum models."""
+        summary = cls.__new__(cls)
+        summary.data = data
+        summary.next_token = next_token
+        return summary
+
+    def column(self, name: str) -> List:
+        """Returns one attribute of every datum, e.g. "score" or "contributors.timing"."""
+        return list(map(attrgetter(name), self.data))
+
+    def to_records(self) -> List[Dict]:
+        """Returns every datum as a flat dict.
+
+        Nested models are flattened with their field name as prefix, e.g.
+        contributors.timing becomes "contributors_timing".
+        """
+        return [_flatten(datum) for datum in self.data]
+
+    def to_dataframe(self):
+        """Returns the data as a pandas DataFrame with one row per datum.
+
+        Requires pandas (the "pandas" extra).
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError(
+                "to_dataframe requires pandas; install oura-py[pandas]"
+            ) from e
+        return pd.DataFrame.from_records(self.to_records())
+
+
+def _flatten(model: _Model, prefix: str = "") -> Dict:
+    record = {}
+    for name in model.__slots__:
+        value = getattr(model, name)
+        if isinstance(value, _Model):
+            record.update(_flatten(value, f"{prefix}{name}_"))
+        else:
+            record[f"{prefix}{name}"] = value
+    return record
 
 
 class Result:
@@ -11,13 +100,36 @@ class Result:
         data: A list of dictionaries (or single dictionary) containing the response data.
     """
 
+    __slots__ = ("status_code", "message", "data")
+
+    status_code: int
+    message: str
+    data: List[Dict] | Dict
+
     def __init__(self, status_code: int, message: str, data: List[Dict] = None) -> None:
-        self.status_code = int(status_code)
-        self.message = str(message)
-        self.data = data if data else []
+        self.status_code = status_code
+        self.message = message
+        self.data = data if data is not None else []
+
 
+class RawResult:
+    """The undecoded result of an HTTP request operation.
 
-class PersonalInfo:
+    Attributes:
+        status_code: An integer indicating the status code of the result.
+        message: A human readable string describing the reason.
+        content: The raw response body.
+    """
+
+    __slots__ = ("status_code", "message", "content")
+
+    def __init__(self, status_code: int, message: str, content: bytes) -> None:
+        self.status_code = status_code
+        self.message = message
+        self.content = content
+
+
+class PersonalInfo(_Model):
     """The user's personal info.
 
     Attributes:
@@ -29,6 +141,15 @@ class PersonalInfo:
         email: The user's email address.
     """
 
+    __slots__ = ("id", "age", "weight", "height", "sex", "email")
+
+    id: str
+    age: int
+    weight: float
+    height: float
+    sex: str
+    email: str
+
     def __init__(
         self,
         id: str,
@@ -38,15 +159,15 @@ class PersonalInfo:
         biological_sex: str,
         email: str,
     ) -> None:
-        self.id = str(id)
-        self.age = int(age)
-        self.weight = float(weight)
-        self.height = float(height)
-        self.sex = str(biological_sex)
-        self.email = str(email)
+        self.id = id
+        self.age = age
+        self.weight = weight
+        self.height = height
+        self.sex = biological_sex
+        self.email = email
 
 
-class RingConfigData:
+class RingConfigData(_Model):
     """Represents the configuration of a ring.
 
     Attributes:
@@ -60,6 +181,16 @@ class RingConfigData:
         next_token (str): The next token for pagination or other purposes.
     """
 
+    __slots__ = (
+        "id",
+        "color",
+        "design",
+        "firmware_version",
+        "hardware_type",
+        "set_up_at",
+        "size",
+    )
+
     def __init__(
         self,
         id: str,
@@ -75,11 +206,11 @@ class RingConfigData:
         self.design = design
         self.firmware_version = firmware_version
         self.hardware_type = hardware_type
-        self.set_up_at = set_up_at
+        self.set_up_at = _parse_datetime(set_up_at)
         self.size = size
 
 
-class RingConfig:
+class RingConfig(_Summary):
     """Represents the configuration of a ring.
 
     Attributes:
@@ -87,14 +218,26 @@ class RingConfig:
         next_token (str): Document ID for next result, if available.
     """
 
+    __slots__ = ("data", "next_token")
+
     def __init__(
         self, data: List[RingConfigData], next_token: str | None = None
     ) -> None:
-        self.data = [RingConfigData(**d) for d in data] if data else []
+        self.data = [RingConfigData.from_dict(d) for d in data] if data else []
         self.next_token = next_token
 
 
-class SleepSummaryContributors:
+class SleepSummaryContributors(_Model):
+    __slots__ = (
+        "deep_sleep",
+        "efficiency",
+        "latency",
+        "rem_sleep",
+        "restfulness",
+        "timing",
+        "total_sleep",
+    )
+
     def __init__(
         self,
         deep_sleep: int,
@@ -114,31 +257,46 @@ class SleepSummaryContributors:
         self.total_sleep = total_sleep
 
 
-class SleepSummaryDatum:
+class SleepSummaryDatum(_Model):
+    __slots__ = ("id", "contributors", "day", "score", "timestamp")
+
     def __init__(
         self,
         id: str,
         contributors: SleepSummaryContributors,
-        day: datetime,
+        day: date,
         score: int,
         timestamp: datetime,
     ) -> None:
         self.id = id
-        self.contributors = SleepSummaryContributors(**contributors)
-        self.day = day
+        self.contributors = SleepSummaryContributors.from_dict(contributors)
+        self.day = _parse_date(day)
         self.score = score
-        self.timestamp = timestamp
+        self.timestamp = _parse_datetime(timestamp)
+
 
+class SleepSummary(_Summary):
+    __slots__ = ("data", "next_token")
 
-class SleepSummary:
     def __init__(
         self, data: List[SleepSummaryDatum], next_token: str | None = None
     ) -> None:
-        self.data = [SleepSummaryDatum(**d) for d in data] if data else []
+        self.data = [SleepSummaryDatum.from_dict(d) for d in data] if data else []
         self.next_token = next_token
 
 
-class ReadinessSummaryContributors:
+class ReadinessSummaryContributors(_Model):
+    __slots__ = (
+        "activity_balance",
+        "body_temperature",
+        "hrv_balance",
+        "previous_day_activity",
+        "previous_night",
+        "recovery_index",
+        "resting_heart_rate",
+        "sleep_balance",
+    )
+
     def __init__(
         self,
         activity_balance: int,
@@ -150,7 +308,7 @@ class ReadinessSummaryContributors:
         resting_heart_rate: int,
         sleep_balance: int,
     ) -> None:
-        self.acitvity_balance = activity_balance
+        self.activity_balance = activity_balance
         self.body_temperature = body_temperature
         self.hrv_balance = hrv_balance
         self.previous_day_activity = previous_day_activity
@@ -159,36 +317,62 @@ class ReadinessSummaryContributors:
         self.resting_heart_rate = resting_heart_rate
         self.sleep_balance = sleep_balance
 
+    @property
+    def acitvity_balance(self) -> int:
+        """Misspelled alias of activity_balance, kept for backwards compatibility."""
+        return self.activity_balance
+
+
+class ReadinessSummaryDatum(_Model):
+    __slots__ = (
+        "id",
+        "contributors",
+        "day",
+        "score",
+        "temperature_deviation",
+        "temperature_trend_deviation",
+        "timestamp",
+    )
 
-class ReadinessSummaryDatum:
     def __init__(
         self,
         id: str,
         contributors: ReadinessSummaryContributors,
-        day: datetime,
+        day: date,
         score: int,
         temperature_deviation: float,
         temperature_trend_deviation: float,
         timestamp: datetime,
     ) -> None:
         self.id = id
-        self.contributors = ReadinessSummaryContributors(**contributors)
-        self.day = day
+        self.contributors = ReadinessSummaryContributors.from_dict(contributors)
+        self.day = _parse_date(day)
         self.score = score
         self.temperature_deviation = temperature_deviation
         self.temperature_trend_deviation = temperature_trend_deviation
-        self.timestamp = timestamp
+        self.timestamp = _parse_datetime(timestamp)
+
 
+class ReadinessSummary(_Summary):
+    __slots__ = ("data", "next_token")
 
-class ReadinessSummary:
     def __init__(
         self, data: List[ReadinessSummaryDatum], next_token: str | None = None
     ) -> None:
-        self.data = [ReadinessSummaryDatum(**d) for d in data] if data else []
+        self.data = [ReadinessSummaryDatum.from_dict(d) for d in data] if data else []
         self.next_token = next_token
 
 
-class ActivitySummaryContributors:
+class ActivitySummaryContributors(_Model):
+    __slots__ = (
+        "meet_daily_targets",
+        "move_every_hour",
+        "recovery_time",
+        "stay_active",
+        "training_frequency",
+        "training_volume",
+    )
+
     def __init__(
         self,
         meet_daily_targets: int,
@@ -206,16 +390,47 @@ class ActivitySummaryContributors:
         self.training_volume = training_volume
 
 
-class ActivitySummaryMET:
+class ActivitySummaryMET(_Model):
+    __slots__ = ("interval", "items", "timestamp")
+
     def __init__(
         self, interval: float, items: List[float], timestamp: datetime
     ) -> None:
         self.interval = interval
         self.items = items
-        self.timestamp = timestamp
-
+        self.timestamp = _parse_datetime(timestamp)
+
+
+class ActivitySummaryDatum(_Model):
+    __slots__ = (
+        "id",
+        "class_5_min",
+        "score",
+        "active_calories",
+        "average_met_minutes",
+        "contributors",
+        "equivalent_walking_distance",
+        "high_activity_met_minutes",
+        "high_activity_time",
+        "inactivity_alerts",
+        "low_activity_met_minutes",
+        "low_activity_time",
+        "medium_activity_met_minutes",
+        "medium_activity_time",
+        "met",
+        "meters_to_target",
+        "non_wear_time",
+        "resting_time",
+        "sedentary_met_minutes",
+        "sedentary_time",
+        "steps",
+        "target_calories",
+        "target_meters",
+        "total_calories",
+        "day",
+        "timestamp",
+    )
 
-class ActivitySummaryDatum:
     def __init__(
         self,
         id: str,
@@ -242,7 +457,7 @@ class ActivitySummaryDatum:
         target_calories: int,
         target_meters: int,
         total_calories: int,
-        day: datetime,
+        day: date,
         timestamp: datetime,
     ) -> None:
         self.id = id
@@ -250,7 +465,7 @@ class ActivitySummaryDatum:
         self.score = score
         self.active_calories = active_calories
         self.average_met_minutes = average_met_minutes
-        self.contributors = ActivitySummaryContributors(**contributors)
+        self.contributors = ActivitySummaryContributors.from_dict(contributors)
         self.equivalent_walking_distance = equivalent_walking_distance
         self.high_activity_met_minutes = high_activity_met_minutes
         self.high_activity_time = high_activity_time
@@ -259,7 +474,7 @@ class ActivitySummaryDatum:
         self.low_activity_time = low_activity_time
         self.medium_activity_met_minutes = medium_activity_met_minutes
         self.medium_activity_time = medium_activity_time
-        self.met = ActivitySummaryMET(**met)
+        self.met = ActivitySummaryMET.from_dict(met)
         self.meters_to_target = meters_to_target
         self.non_wear_time = non_wear_time
         self.resting_time = resting_time
@@ -269,19 +484,23 @@ class ActivitySummaryDatum:
         self.target_calories = target_calories
         self.target_meters = target_meters
         self.total_calories = total_calories
-        self.day = day
-        self.timestamp = timestamp
+        self.day = _parse_date(day)
+        self.timestamp = _parse_datetime(timestamp)
 
 
-class ActivitySummary:
+class ActivitySummary(_Summary):
+    __slots__ = ("data", "next_token")
+
     def __init__(
         self, data: List[ActivitySummaryDatum], next_token: str | None = None
     ) -> None:
-        self.data = [ActivitySummaryDatum(**d) for d in data] if data else []
+        self.data = [ActivitySummaryDatum.from_dict(d) for d in data] if data else []
         self.next_token = next_token
 
 
-class HeartRateDatum:
+class HeartRateDatum(_Model):
+    __slots__ = ("bpm", "source", "timestamp")
+
     def __init__(
         self,
         bpm: int,
@@ -290,34 +509,65 @@ class HeartRateDatum:
     ) -> None:
         self.bpm = bpm
         self.source = source
-        self.timestamp = timestamp
+        self.timestamp = _parse_datetime(timestamp)
+
 
+class HeartRateSummary(_Summary):
+    __slots__ = ("data", "next_token")
 
-class HeartRateSummary:
     def __init__(
         self, data: List[HeartRateDatum], next_token: str | None = None
     ) -> None:
-        self.data = [HeartRateDatum(**d) for d in data] if data else []
+        self.data = [HeartRateDatum.from_dict(d) for d in data] if data else []
         self.next_token = next_token
 
 
-class StressDatum:
+class StressDatum(_Model):
+    __slots__ = ("id", "day", "stress_high", "stress_low", "day_summary")
+
     def __init__(
         self,
         id: str,
-        day: datetime,
+        day: date,
         stress_high: int,
         stress_low: int,
         day_summary: str,
     ) -> None:
         self.id = id
-        self.day = day
+        self.day = _parse_date(day)
         self.stress_high = stress_high
         self.stress_low = stress_low
         self.day_summary = day_summary
 
 
-class StressSummary:
+class StressSummary(_Summary):
+    __slots__ = ("data", "next_token")
+
     def __init__(self, data: List[StressDatum], next_token: str | None = None) -> None:
-        self.data = [StressDatum(**d) for d in data] if data else []
+        self.data = [StressDatum.from_dict(d) for d in data] if data else []
         self.next_token = next_token
+
+
+# summary type -> (endpoint, summary class, single-document class)
+SUMMARY_SPEC = {
+    "sleep": ("daily_sleep", SleepSummary, SleepSummaryDatum),
+    "readiness": ("daily_readiness", ReadinessSummary, ReadinessSummaryDatum),
+    "activity": ("daily_activity", ActivitySummary, ActivitySummaryDatum),
+    "heartrate": ("heartrate", HeartRateSummary, HeartRateDatum),
+    "stress": ("daily_stress", StressSummary, StressDatum),
+}
+
+
+def summary_spec(summary_type: str) -> tuple:
+    """Returns the (endpoint, summary class, single-document class) for a summary type.
+
+    Raises:
+        ValueError: If summary_type is not a known summary.
+    """
+    try:
+        return SUMMARY_SPEC[summary_type]
+    except KeyError:
+        raise ValueError(
+            f"Unknown summary type {summary_type!r}, expected one of "
+            f"{', '.join(SUMMARY_SPEC)}"
+        ) from None
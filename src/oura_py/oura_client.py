@@ -1,18 +1,26 @@
-from datetime import date, timedelta
 import logging
-from .helpers import RequestManager
-from .exceptions import OuraPyException
+from datetime import date
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from .helpers import DEFAULT_CACHE_TTL, RequestManager, endpoint_path, prep_dates
 from .models import (
+    SUMMARY_SPEC,
     PersonalInfo,
+    RawResult,
+    Result,
     RingConfig,
+    RingConfigData,
     SleepSummary,
     SleepSummaryDatum,
+    StressSummary,
+    StressDatum,
     ReadinessSummary,
     ReadinessSummaryDatum,
     ActivitySummary,
     ActivitySummaryDatum,
     HeartRateSummary,
     HeartRateDatum,
+    summary_spec,
 )
 
 
@@ -25,6 +33,13 @@ class OuraClient:
         path: str = "usercollection",
         ssl_verify: bool = True,
         logger: logging.Logger = None,
+        cache_maxsize: int = 256,
+        cache_fallback: bool = False,
+        max_retries: int = 3,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_mode: str = "enabled",
+        timeout: float | tuple[float, float] | None = (5.0, 10.0),
+        rate_limit: int | None = None,
     ):
         """Initializes the OuraClient instance.
 
@@ -35,6 +50,13 @@ class OuraClient:
             path (str, optional): The API path. Defaults to "usercollection".
             ssl_verify (bool, optional): Whether to verify SSL certificates. Defaults to True.
             logger (logging.Logger, optional): Logger instance for logging. Defaults to None.
+            cache_maxsize (int, optional): Maximum number of cached GET responses, 0 disables caching. Defaults to 256.
+            cache_fallback (bool, optional): Whether to serve an expired cached response when the request fails. Defaults to False.
+            max_retries (int, optional): Maximum number of retries for transient GET failures, 0 disables retrying. Defaults to 3.
+            cache_ttl (float, optional): Lifetime in seconds of cached personal info and ring configuration, 0 disables caching. Defaults to 3600.
+            cache_mode (str, optional): One of "enabled", "read-only", "replay" or "disabled". Defaults to "enabled".
+            timeout (float | tuple[float, float], optional): Connect and read timeout in seconds, None waits forever. Defaults to (5.0, 10.0).
+            rate_limit (int, optional): Maximum requests per minute to send, throttling locally instead of hitting 429s. Defaults to None.
         """
         self.url = f"https://{hostname}/{ver}/{path}"
         self._logger = logger or logging.getLogger(__name__)
@@ -45,22 +67,59 @@ class OuraClient:
             path=path,
             ssl_verify=ssl_verify,
             logger=self._logger,
+            cache_maxsize=cache_maxsize,
+            cache_fallback=cache_fallback,
+            max_retries=max_retries,
+            cache_ttl=cache_ttl,
+            cache_mode=cache_mode,
+            timeout=timeout,
+            rate_limit=rate_limit,
         )
 
+    def __enter__(self) -> "OuraClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session."""
+        self._manager.close()
+
+    def clear_cache(self) -> None:
+        """Discards every cached response."""
+        self._manager.clear_cache()
+
+    def get_summary(
+        self,
+        summary_type: str,
+        start: str | None = None,
+        end: str | None = None,
+        next_token: str | None = None,
+    ):
+        """Fetches a summary by type for a date range, or a single document.
+
+        Args:
+            summary_type (str): One of "sleep", "readiness", "activity", "heartrate" or "stress".
+            start (str, optional): Start date in YYYY-MM-DD format. Defaults to the day before end.
+            end (str, optional): End date in YYYY-MM-DD format. Defaults to today.
+            next_token (str, optional): Document ID to fetch a single datum instead of a range. Defaults to None.
+
+        Returns:
+            The summary model for the type, or its datum model when next_token is given.
+
+        Raises:
+            ValueError: If summary_type is not a known summary.
+        """
+        return self._get_summary_generic(summary_type, start, end, next_token)
+
     def get_sleep_summary(
         self,
         start: str | None = None,
         end: str | None = None,
         next_token: str | None = None,
     ) -> SleepSummary | SleepSummaryDatum:
-        return self._get_summary_generic(
-            summary_endpoint="daily_sleep",
-            data_class=SleepSummary,
-            data_class_datum=SleepSummaryDatum,
-            start=start,
-            end=end,
-            next_token=next_token,
-        )
+        return self._get_summary_generic("sleep", start, end, next_token)
 
     def get_readiness_summary(
         self,
@@ -68,14 +127,7 @@ class OuraClient:
         end: str | None = None,
         next_token: str | None = None,
     ) -> ReadinessSummary | ReadinessSummaryDatum:
-        return self._get_summary_generic(
-            summary_endpoint="daily_readiness",
-            data_class=ReadinessSummary,
-            data_class_datum=ReadinessSummaryDatum,
-            start=start,
-            end=end,
-            next_token=next_token,
-        )
+        return self._get_summary_generic("readiness", start, end, next_token)
 
     def get_activity_summary(
         self,
@@ -83,14 +135,7 @@ class OuraClient:
         end: str | None = None,
         next_token: str | None = None,
     ) -> ActivitySummary | ActivitySummaryDatum:
-        return self._get_summary_generic(
-            summary_endpoint="daily_activity",
-            data_class=ActivitySummary,
-            data_class_datum=ActivitySummaryDatum,
-            start=start,
-            end=end,
-            next_token=next_token,
-        )
+        return self._get_summary_generic("activity", start, end, next_token)
 
     def get_heartrate_summary(
         self,
@@ -98,61 +143,235 @@ class OuraClient:
         end: str | None = None,
         next_token: str | None = None,
     ) -> HeartRateSummary | HeartRateDatum:
-        return self._get_summary_generic(
-            summary_endpoint="heartrate",
-            data_class=HeartRateSummary,
-            data_class_datum=HeartRateDatum,
-            start=start,
-            end=end,
-            next_token=next_token,
-        )
+        return self._get_summary_generic("heartrate", start, end, next_token)
+
+    def get_stress_summary(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        next_token: str | None = None,
+    ) -> StressSummary | StressDatum:
+        return self._get_summary_generic("stress", start, end, next_token)
+
+    def iter_sleep_summary(
+        self, start: str | None = None, end: str | None = None, prefetch: bool = True
+    ) -> Iterator[SleepSummaryDatum]:
+        """Yields every sleep datum in the date range, following next_token pages.
+
+        Args:
+            start (str, optional): Start date in YYYY-MM-DD format. Defaults to the day before end.
+            end (str, optional): End date in YYYY-MM-DD format. Defaults to today.
+            prefetch (bool, optional): Whether to fetch the next page in the background while the current one is consumed. Defaults to True.
+
+        Yields:
+            SleepSummaryDatum: Each sleep datum in the range.
+        """
+        yield from self._iter_summary_generic("sleep", start, end, prefetch=prefetch)
+
+    def get_all_sleep_summary(
+        self, start: str | None = None, end: str | None = None
+    ) -> SleepSummary:
+        """Fetches every page of sleep data in the date range into one summary.
+
+        Pages are fetched through iter_sleep_summary, so each request overlaps
+        with parsing the previous page.
+
+        Args:
+            start (str, optional): Start date in YYYY-MM-DD format. Defaults to the day before end.
+            end (str, optional): End date in YYYY-MM-DD format. Defaults to today.
+
+        Returns:
+            SleepSummary: All sleep data in the range, with no next_token.
+        """
+        return SleepSummary.from_models(list(self.iter_sleep_summary(start, end)))
+
+    def iter_heartrate(
+        self, start: str | None = None, end: str | None = None
+    ) -> Iterator[HeartRateDatum]:
+        """Yields heart rate samples while the response is still downloading.
+
+        The body is parsed incrementally with ijson (the "stream" extra), so only
+        one sample is held at a time and iteration can stop early without
+        reading the rest of the payload. next_token pages are followed.
+
+        Args:
+            start (str, optional): Start date in YYYY-MM-DD format. Defaults to the day before end.
+            end (str, optional): End date in YYYY-MM-DD format. Defaults to today.
+
+        Yields:
+            HeartRateDatum: Each heart rate sample in the range.
+        """
+        try:
+            import ijson
+        except ImportError as e:
+            raise ImportError(
+                "iter_heartrate requires ijson; install oura-py[stream]"
+            ) from e
+        start_date, end_date = self._prep_dates(start, end)
+        params = {"start_date": start_date, "end_date": end_date}
+        while True:
+            next_token = []
+            response = self._manager.stream_get("heartrate", params=params)
+            try:
+                events = _capture_next_token(
+                    ijson.parse(response.raw, use_float=True), next_token
+                )
+                for item in ijson.items(events, "data.item"):
+                    yield HeartRateDatum.from_dict(item)
+            finally:
+                response.close()
+            if not next_token or not next_token[0]:
+                return
+            self._logger.debug("next_token=%s", next_token[0])
+            params = {**params, "next_token": next_token[0]}
+
+    def fetch_all(self, start: str | None = None, end: str | None = None) -> dict:
+        """Fetches every summary type for the date range concurrently.
+
+        Each summary is requested from its own worker thread over the shared
+        session, so the call takes about as long as the slowest endpoint.
+
+        Args:
+            start (str, optional): Start date in YYYY-MM-DD format. Defaults to the day before end.
+            end (str, optional): End date in YYYY-MM-DD format. Defaults to today.
+
+        Returns:
+            dict: The summaries keyed by type ("sleep", "readiness", "activity", "heartrate", "stress").
+        """
+        with ThreadPoolExecutor(max_workers=len(SUMMARY_SPEC)) as executor:
+            futures = {
+                summary_type: executor.submit(
+                    self._get_summary_generic, summary_type, start, end
+                )
+                for summary_type in SUMMARY_SPEC
+            }
+            return {
+                summary_type: future.result()
+                for summary_type, future in futures.items()
+            }
+
+    def get_daily_summary(self, day: str | None = None) -> dict:
+        """Fetches every summary type for a single day concurrently.
+
+        Args:
+            day (str, optional): The day in YYYY-MM-DD format. Defaults to today.
+
+        Returns:
+            dict: The summaries keyed by type, as returned by fetch_all.
+        """
+        day = day or date.today().isoformat()
+        return self.fetch_all(day, day)
+
+    def get_many(self, specs: list[tuple[str, dict | None]]) -> list[Result]:
+        """Sends a GET for each (endpoint, params) pair concurrently.
+
+        Requests go through the shared session, so they reuse pooled
+        connections, the response cache and the retry policy.
+
+        Args:
+            specs (list[tuple[str, dict]]): The endpoints to fetch, each with its query parameters or None.
+
+        Returns:
+            list[Result]: One result per spec, in the order given.
+        """
+        if not specs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(16, len(specs))) as executor:
+            futures = [
+                executor.submit(self._manager.get, endpoint, params)
+                for endpoint, params in specs
+            ]
+            return [future.result() for future in futures]
+
+    def get_raw(self, endpoint: str, params: dict | None = None) -> RawResult:
+        """Fetches an endpoint without decoding the response body.
+
+        Useful when only the status matters or the body is handed to another
+        parser, since it skips JSON decoding and model construction.
+
+        Args:
+            endpoint (str): The endpoint relative to the API path, e.g. "heartrate".
+            params (dict, optional): Query parameters to include in the request. Defaults to None.
+
+        Returns:
+            RawResult: The status code, reason and raw body of the response.
+        """
+        return self._manager.get(endpoint, params=params, raw=True)
 
     def get_personal_info(self) -> PersonalInfo:
-        result = self._manager.get("personal_info")
-        data = PersonalInfo(**result.data)
-        return data
-
-    def get_ring_config(self, document_id: str | None = None) -> RingConfig:
-        endpoint = (
-            "ring_configuration"
-            if document_id is None
-            else f"ring_configuration/{document_id}"
-        )
-        result = self._manager.get(endpoint=endpoint)
-        data = RingConfig(**result.data)
-        return data
+        return self._manager.get_typed("personal_info", PersonalInfo)
+
+    def get_ring_config(
+        self, document_id: str | None = None
+    ) -> RingConfig | RingConfigData:
+        model = RingConfig if document_id is None else RingConfigData
+        endpoint = endpoint_path("ring_configuration", document_id)
+        return self._manager.get_typed(endpoint, model)
 
     def _get_summary_generic(
         self,
-        summary_endpoint: str,
-        data_class: type,
-        data_class_datum: type,
+        summary_type: str,
         start: str | None = None,
         end: str | None = None,
         next_token: str | None = None,
     ):
+        summary_endpoint, data_class, data_class_datum = summary_spec(summary_type)
         if next_token:
-            self._logger.debug(msg=f"next_token={next_token}")
-            result = self._manager.get(f"{summary_endpoint}/{next_token}")
-            data = data_class_datum(**result.data)
-            return data
+            self._logger.debug("next_token=%s", next_token)
+            return self._manager.get_typed(
+                endpoint_path(summary_endpoint, next_token), data_class_datum
+            )
         start_date, end_date = self._prep_dates(start, end)
-        result = self._manager.get(
-            f"{summary_endpoint}",
+        return self._manager.get_typed(
+            summary_endpoint,
+            data_class,
             params={"start_date": start_date, "end_date": end_date},
         )
-        data = data_class(**result.data)
-        return data
+
+    def _iter_summary_generic(
+        self,
+        summary_type: str,
+        start: str | None = None,
+        end: str | None = None,
+        prefetch: bool = True,
+    ) -> Iterator:
+        summary_endpoint, data_class, _ = SUMMARY_SPEC[summary_type]
+        start_date, end_date = self._prep_dates(start, end)
+        params = {"start_date": start_date, "end_date": end_date}
+        if not prefetch:
+            while True:
+                page = self._manager.get_typed(summary_endpoint, data_class, params)
+                yield from page.data
+                if not page.next_token:
+                    return
+                self._logger.debug("next_token=%s", page.next_token)
+                params = {**params, "next_token": page.next_token}
+        # The next page is requested as soon as its token is known, so the
+        # network round trip overlaps with the caller consuming this page.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self._manager.get_typed, summary_endpoint, data_class, params
+            )
+            while future is not None:
+                page = future.result()
+                future = None
+                if page.next_token:
+                    self._logger.debug("next_token=%s", page.next_token)
+                    params = {**params, "next_token": page.next_token}
+                    future = executor.submit(
+                        self._manager.get_typed, summary_endpoint, data_class, params
+                    )
+                yield from page.data
 
     def _prep_dates(
         self, start_date: str | None = None, end_date: str | None = None
     ) -> tuple[str, str]:
-        end = date.fromisoformat(end_date) if end_date else date.today()
-        start = (
-            date.fromisoformat(start_date) if start_date else end - timedelta(days=1)
-        )
-        if start > end:
-            log_msg = f"Start date must be before end date. Provided start: {start_date}, end: {end_date}"
-            self._logger.error(msg=log_msg)
-            raise OuraPyException("Start date must be before end date.")
-        return str(start), str(end)
+        return prep_dates(start_date, end_date, logger=self._logger)
+
+
+def _capture_next_token(events: Iterator, found: list) -> Iterator:
+    """Passes ijson events through, recording the top-level next_token value."""
+    for prefix, event, value in events:
+        if prefix == "next_token":
+            found.append(value)
+        yield prefix, event, value
@@ -1,4 +1,5 @@
 import pytest
+import requests
 from unittest.mock import patch
 from oura_py.auth import PersonalTokenRequestHandler
 
@@ -8,7 +9,27 @@ def handler():
     return PersonalTokenRequestHandler(personal_access_token="test_token")
 
 
-@patch("requests.get")
+def test_session_headers(handler):
+    assert handler._session.headers["Authorization"] == "Bearer test_token"
+
+
+@patch("requests.Session.get")
+def test_shared_session(mock_get):
+    session = requests.Session()
+    handler = PersonalTokenRequestHandler("test_token", session=session)
+    assert handler._session is session
+    assert "Authorization" not in session.headers
+
+    handler.make_request(url="https://api.example.com/data")
+
+    mock_get.assert_called_once_with(
+        "https://api.example.com/data",
+        params=None,
+        headers={"Authorization": "Bearer test_token"},
+    )
+
+
+@patch("requests.Session.get")
 def test_make_request_get(mock_get, handler):
     mock_get.return_value.status_code = 200
     mock_get.return_value.text = "Success"
@@ -16,13 +37,13 @@ def test_make_request_get(mock_get, handler):
     response = handler.make_request(url="https://api.example.com/data", method="GET")
 
     mock_get.assert_called_once_with(
-        "https://api.example.com/data", headers={"Authorization": "Bearer test_token"}
+        "https://api.example.com/data", params=None, headers=None
     )
     assert response.status_code == 200
     assert response.text == "Success"
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_make_request_post(mock_post, handler):
     mock_post.return_value.status_code = 201
     mock_post.return_value.text = "Created"
@@ -30,13 +51,13 @@ def test_make_request_post(mock_post, handler):
     response = handler.make_request(url="https://api.example.com/data", method="POST")
 
     mock_post.assert_called_once_with(
-        "https://api.example.com/data", headers={"Authorization": "Bearer test_token"}
+        "https://api.example.com/data", params=None, headers=None
     )
     assert response.status_code == 201
     assert response.text == "Created"
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_make_request_no_url(mock_get, handler):
     with pytest.raises(TypeError):
         handler.make_request(method="GET")
@@ -45,3 +66,23 @@ def test_make_request_no_url(mock_get, handler):
 def test_make_request_invalid_method(handler):
     with pytest.raises(ValueError):
         handler.make_request(url="https://api.example.com/data", method="PUT")
+
+
+@patch("requests.Session.close")
+def test_close_only_owned_session(mock_close):
+    with PersonalTokenRequestHandler("test_token", session=requests.Session()):
+        pass
+    mock_close.assert_not_called()
+
+    with PersonalTokenRequestHandler("test_token"):
+        pass
+    mock_close.assert_called_once()
+
+
+@patch("requests.Session.get")
+def test_make_json_request(mock_get, handler):
+    mock_get.return_value.content = b'{"data": [1, 2]}'
+
+    data = handler.make_json_request(url="https://api.example.com/data")
+
+    assert data == {"data": [1, 2]}
@@ -0,0 +1,231 @@
+import json
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from oura_py.async_oura_client import AsyncOuraClient  # noqa: E402
+from oura_py.exceptions import OuraPyException  # noqa: E402
+from oura_py.models import SleepSummary  # noqa: E402
+
+SLEEP_DATUM = {
+    "id": "abc",
+    "contributors": {
+        "deep_sleep": 1,
+        "efficiency": 2,
+        "latency": 3,
+        "rem_sleep": 4,
+        "restfulness": 5,
+        "timing": 6,
+        "total_sleep": 7,
+    },
+    "day": "2024-01-01",
+    "score": 80,
+    "timestamp": "2024-01-01T00:00:00+00:00",
+}
+
+
+def _response(payload, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.reason_phrase = "OK"
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_get_sleep_summary(mock_request):
+    mock_request.return_value = _response({"data": [SLEEP_DATUM], "next_token": None})
+
+    async def run():
+        async with AsyncOuraClient("test_token") as client:
+            return await client.get_sleep_summary("2024-01-01", "2024-01-02")
+
+    summary = asyncio.run(run())
+
+    assert isinstance(summary, SleepSummary)
+    assert summary.data[0].score == 80
+    mock_request.assert_awaited_once_with(
+        method="GET",
+        url="daily_sleep",
+        params={"start_date": "2024-01-01", "end_date": "2024-01-02"},
+        content=None,
+        headers=None,
+    )
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_iter_sleep_summary_follows_next_token(mock_request):
+    mock_request.side_effect = [
+        _response({"data": [SLEEP_DATUM], "next_token": "tok"}),
+        _response({"data": [SLEEP_DATUM], "next_token": None}),
+    ]
+
+    async def run():
+        async with AsyncOuraClient("test_token") as client:
+            return [
+                d async for d in client.iter_sleep_summary("2024-01-01", "2024-01-02")
+            ]
+
+    data = asyncio.run(run())
+
+    assert len(data) == 2
+    assert mock_request.await_args_list[1].kwargs["params"]["next_token"] == "tok"
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_fetch_all(mock_request):
+    mock_request.return_value = _response({"data": [], "next_token": None})
+
+    async def run():
+        async with AsyncOuraClient("test_token") as client:
+            return await client.fetch_all("2024-01-01", "2024-01-02")
+
+    summaries = asyncio.run(run())
+
+    assert set(summaries) == {"sleep", "readiness", "activity", "heartrate", "stress"}
+    assert mock_request.await_count == 5
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_get_many(mock_request):
+    mock_request.return_value = _response({"data": [], "next_token": None})
+
+    async def run():
+        async with AsyncOuraClient("test_token") as client:
+            return await client.get_many(
+                [
+                    ("daily_spo2", {"start_date": "2024-01-01"}),
+                    ("daily_spo2", {"start_date": "2024-01-02"}),
+                ]
+            )
+
+    results = asyncio.run(run())
+
+    assert len(results) == 2
+    assert [
+        call.kwargs["params"]["start_date"] for call in mock_request.await_args_list
+    ] == ["2024-01-01", "2024-01-02"]
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_personal_info_is_cached(mock_request):
+    mock_request.return_value = _response(
+        {
+            "id": "abc",
+            "age": 30,
+            "weight": 70.0,
+            "height": 1.8,
+            "biological_sex": "f",
+            "email": "a@example.com",
+        }
+    )
+
+    async def run():
+        async with AsyncOuraClient("test_token") as client:
+            first = await client.get_personal_info()
+            second = await client.get_personal_info()
+            client.clear_cache()
+            await client.get_personal_info()
+            return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first.id == second.id == "abc"
+    assert mock_request.await_count == 2
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_cache_hits_do_not_share_models(mock_request):
+    mock_request.return_value = _response({"data": [], "next_token": None})
+
+    async def run():
+        async with AsyncOuraClient("test_token") as client:
+            (await client.get_ring_config()).data.append("mutated")
+            return await client.get_ring_config()
+
+    ring_config = asyncio.run(run())
+
+    assert mock_request.await_count == 1
+    assert ring_config.data == []
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_cache_ttl_zero_disables_cache(mock_request):
+    mock_request.return_value = _response({"data": [], "next_token": None})
+
+    async def run():
+        async with AsyncOuraClient("test_token", cache_ttl=0) as client:
+            await client.get_ring_config()
+            await client.get_ring_config()
+
+    asyncio.run(run())
+
+    assert mock_request.await_count == 2
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_get_sleep_summaries(mock_request):
+    mock_request.return_value = _response({"data": [SLEEP_DATUM], "next_token": None})
+    ranges = [("2024-01-01", "2024-01-31"), ("2024-02-01", "2024-02-29")]
+
+    async def run():
+        async with AsyncOuraClient("test_token") as client:
+            return await client.get_sleep_summaries(ranges, max_concurrency=1)
+
+    summaries = asyncio.run(run())
+
+    assert [type(summary) for summary in summaries] == [SleepSummary, SleepSummary]
+    assert [
+        call.kwargs["params"]["start_date"] for call in mock_request.await_args_list
+    ] == [
+        "2024-01-01",
+        "2024-02-01",
+    ]
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_summaries_are_not_cached(mock_request):
+    mock_request.return_value = _response({"data": [], "next_token": None})
+
+    async def run():
+        async with AsyncOuraClient("test_token") as client:
+            await client.get_sleep_summary("2024-01-01", "2024-01-02")
+            await client.get_sleep_summary("2024-01-01", "2024-01-02")
+
+    asyncio.run(run())
+
+    assert mock_request.await_count == 2
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_replay_mode_never_touches_network(mock_request):
+    async def run():
+        async with AsyncOuraClient("test_token", cache_mode="replay") as client:
+            with pytest.raises(OuraPyException, match="replay"):
+                await client.get_personal_info()
+            with pytest.raises(OuraPyException, match="replay"):
+                await client.get_sleep_summary("2024-01-01", "2024-01-02")
+
+    asyncio.run(run())
+
+    mock_request.assert_not_awaited()
+
+
+def test_invalid_cache_mode():
+    with pytest.raises(ValueError):
+        AsyncOuraClient("test_token", cache_mode="on")
+
+
+@patch("httpx.AsyncClient.request", new_callable=AsyncMock)
+def test_get_summary_rejects_unknown_type(mock_request):
+    async def run():
+        async with AsyncOuraClient("test_token") as client:
+            with pytest.raises(ValueError, match="sleep, readiness"):
+                await client.get_summary("daily_sleep")
+
+    asyncio.run(run())
+
+    mock_request.assert_not_awaited()
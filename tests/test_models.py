@@ -0,0 +1,134 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from oura_py.models import (
+    HeartRateDatum,
+    HeartRateSummary,
+    ReadinessSummary,
+    SleepSummary,
+    SleepSummaryDatum,
+)
+
+
+def test_models_have_no_instance_dict():
+    summary = HeartRateSummary(
+        data=[{"bpm": 60, "source": "awake", "timestamp": "2024-01-01T00:00:00+00:00"}]
+    )
+    assert not hasattr(summary, "__dict__")
+    assert not hasattr(summary.data[0], "__dict__")
+    assert isinstance(summary.data[0], HeartRateDatum)
+    with pytest.raises(AttributeError):
+        summary.data[0].unknown = 1
+
+
+def test_timestamps_are_parsed():
+    datum = SleepSummaryDatum(
+        id="abc",
+        contributors={
+            "deep_sleep": 1,
+            "efficiency": 2,
+            "latency": 3,
+            "rem_sleep": 4,
+            "restfulness": 5,
+            "timing": 6,
+            "total_sleep": 7,
+        },
+        day="2024-01-01",
+        score=80,
+        timestamp="2024-01-01T00:00:00.000+02:00",
+    )
+    assert datum.day == date(2024, 1, 1)
+    assert datum.timestamp == datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+
+
+def test_from_dict_ignores_unknown_keys():
+    datum = HeartRateDatum.from_dict(
+        {
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "source": "awake",
+            "bpm": 60,
+            "added_later": True,
+        }
+    )
+    assert (datum.bpm, datum.source) == (60, "awake")
+
+
+def test_summary_from_dict_ignores_unknown_keys_and_uses_defaults():
+    summary = HeartRateSummary.from_dict(
+        {
+            "data": [
+                {"bpm": 60, "source": "awake", "timestamp": "2024-01-01T00:00:00+00:00"}
+            ],
+            "added_later": True,
+        }
+    )
+    assert summary.next_token is None
+    assert summary.column("bpm") == [60]
+
+
+def test_summary_columns_and_records():
+    summary = SleepSummary(
+        data=[
+            {
+                "id": "abc",
+                "contributors": {
+                    "deep_sleep": 1,
+                    "efficiency": 2,
+                    "latency": 3,
+                    "rem_sleep": 4,
+                    "restfulness": 5,
+                    "timing": 6,
+                    "total_sleep": 7,
+                },
+                "day": "2024-01-01",
+                "score": 80,
+                "timestamp": "2024-01-01T00:00:00+00:00",
+            }
+        ]
+    )
+    assert summary.column("score") == [80]
+    assert summary.column("contributors.timing") == [6]
+    record = summary.to_records()[0]
+    assert record["score"] == 80
+    assert record["contributors_deep_sleep"] == 1
+    assert "contributors" not in record
+
+
+def _readiness_summary():
+    return ReadinessSummary(
+        data=[
+            {
+                "id": "abc",
+                "contributors": {
+                    "activity_balance": 1,
+                    "body_temperature": 2,
+                    "hrv_balance": 3,
+                    "previous_day_activity": 4,
+                    "previous_night": 5,
+                    "recovery_index": 6,
+                    "resting_heart_rate": 7,
+                    "sleep_balance": 8,
+                },
+                "day": "2024-01-01",
+                "score": 80,
+                "temperature_deviation": 0.1,
+                "temperature_trend_deviation": 0.2,
+                "timestamp": "2024-01-01T00:00:00+00:00",
+            }
+        ]
+    )
+
+
+def test_readiness_records_use_api_field_names():
+    summary = _readiness_summary()
+    record = summary.to_records()[0]
+    assert record["contributors_activity_balance"] == 1
+    assert "contributors_acitvity_balance" not in record
+    assert summary.data[0].contributors.acitvity_balance == 1
+
+
+def test_readiness_to_dataframe():
+    pytest.importorskip("pandas")
+    frame = _readiness_summary().to_dataframe()
+    assert "contributors_activity_balance" in frame.columns
+    assert frame["contributors_activity_balance"].tolist() == [1]
@@ -0,0 +1,282 @@
+import io
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from oura_py.oura_client import OuraClient
+from oura_py.exceptions import OuraPyException
+from oura_py.models import (
+    HeartRateSummary,
+    RingConfigData,
+    SleepSummary,
+    SleepSummaryDatum,
+    StressSummary,
+)
+
+SLEEP_DATUM = {
+    "id": "abc",
+    "contributors": {
+        "deep_sleep": 1,
+        "efficiency": 2,
+        "latency": 3,
+        "rem_sleep": 4,
+        "restfulness": 5,
+        "timing": 6,
+        "total_sleep": 7,
+    },
+    "day": "2024-01-01",
+    "score": 80,
+    "timestamp": "2024-01-01T00:00:00+00:00",
+}
+
+
+@pytest.fixture
+def client():
+    with OuraClient(personal_access_token="test_token") as client:
+        yield client
+
+
+def _ok(mock_request, payload):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = json.dumps(payload).encode()
+
+
+@patch("requests.Session.request")
+def test_get_sleep_summary(mock_request, client):
+    _ok(mock_request, {"data": [SLEEP_DATUM], "next_token": None})
+
+    summary = client.get_sleep_summary("2024-01-01", "2024-01-02")
+
+    assert isinstance(summary, SleepSummary)
+    assert summary.data[0].score == 80
+    assert mock_request.call_args.kwargs["url"].endswith("/daily_sleep")
+    assert mock_request.call_args.kwargs["params"] == {
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-02",
+    }
+
+
+@patch("requests.Session.request")
+def test_get_sleep_summary_document(mock_request, client):
+    _ok(mock_request, SLEEP_DATUM)
+
+    datum = client.get_sleep_summary(next_token="abc")
+
+    assert isinstance(datum, SleepSummaryDatum)
+    assert mock_request.call_args.kwargs["url"].endswith("/daily_sleep/abc")
+
+
+@patch("requests.Session.request")
+def test_single_documents_ignore_unknown_keys(mock_request, client):
+    _ok(mock_request, {**SLEEP_DATUM, "new_field": 1})
+    assert isinstance(client.get_sleep_summary(next_token="abc"), SleepSummaryDatum)
+
+    _ok(
+        mock_request,
+        {
+            "id": "ring",
+            "color": "silver",
+            "design": "heritage",
+            "firmware_version": "1.0",
+            "hardware_type": "gen3",
+            "set_up_at": "2024-01-01T00:00:00+00:00",
+            "size": 9,
+            "new_field": 1,
+        },
+    )
+    ring = client.get_ring_config("ring")
+    assert isinstance(ring, RingConfigData)
+    assert mock_request.call_args.kwargs["url"].endswith("/ring_configuration/ring")
+
+    _ok(
+        mock_request,
+        {
+            "id": "abc",
+            "age": 30,
+            "weight": 70.0,
+            "height": 1.8,
+            "biological_sex": "female",
+            "email": "a@example.com",
+            "new_field": 1,
+        },
+    )
+    assert client.get_personal_info().sex == "female"
+
+
+@patch("requests.Session.request")
+def test_get_heartrate_summary(mock_request, client):
+    _ok(mock_request, {"data": [], "next_token": None})
+
+    summary = client.get_heartrate_summary("2024-01-01", "2024-01-02")
+
+    assert isinstance(summary, HeartRateSummary)
+    assert mock_request.call_args.kwargs["url"].endswith("/heartrate")
+
+
+def test_start_after_end(client):
+    with pytest.raises(OuraPyException):
+        client.get_sleep_summary("2024-01-02", "2024-01-01")
+
+
+@patch("requests.Session.request")
+def test_fetch_all(mock_request, client):
+    _ok(mock_request, {"data": [], "next_token": None})
+
+    summaries = client.fetch_all("2024-01-01", "2024-01-02")
+
+    assert set(summaries) == {"sleep", "readiness", "activity", "heartrate", "stress"}
+    assert isinstance(summaries["sleep"], SleepSummary)
+    assert mock_request.call_count == 5
+
+
+@patch("requests.Session.request")
+def test_get_daily_summary(mock_request, client):
+    _ok(mock_request, {"data": [], "next_token": None})
+
+    summaries = client.get_daily_summary("2024-01-01")
+
+    assert isinstance(summaries["sleep"], SleepSummary)
+    assert mock_request.call_args.kwargs["params"] == {
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-01",
+    }
+
+
+@patch("requests.Session.request")
+def test_get_many(mock_request, client):
+    def respond(method, url, params, **kwargs):
+        response = MagicMock(status_code=200, reason="OK")
+        response.content = json.dumps({"day": params["start_date"]}).encode()
+        return response
+
+    mock_request.side_effect = respond
+
+    results = client.get_many(
+        [
+            ("daily_spo2", {"start_date": "2024-01-01"}),
+            ("daily_spo2", {"start_date": "2024-01-02"}),
+        ]
+    )
+
+    assert [result.data["day"] for result in results] == ["2024-01-01", "2024-01-02"]
+    assert mock_request.call_count == 2
+
+
+@patch("requests.Session.request")
+def test_get_raw(mock_request, client):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = b"not json"
+
+    result = client.get_raw("heartrate")
+
+    assert result.status_code == 200
+    assert result.content == b"not json"
+
+
+@patch("requests.Session.request")
+def test_get_stress_summary(mock_request, client):
+    _ok(
+        mock_request,
+        {
+            "data": [
+                {
+                    "id": "abc",
+                    "day": "2024-01-01",
+                    "stress_high": 3600,
+                    "stress_low": 1800,
+                    "day_summary": "normal",
+                }
+            ],
+            "next_token": None,
+        },
+    )
+
+    summary = client.get_stress_summary("2024-01-01", "2024-01-02")
+
+    assert isinstance(summary, StressSummary)
+    assert summary.data[0].stress_high == 3600
+    assert mock_request.call_args.kwargs["url"].endswith("/daily_stress")
+
+
+@patch("requests.Session.get")
+def test_iter_heartrate(mock_get, client):
+    pytest.importorskip("ijson")
+    pages = [
+        {
+            "data": [
+                {"bpm": 60, "source": "awake", "timestamp": "2024-01-01T00:00:00"}
+            ],
+            "next_token": "tok",
+        },
+        {
+            "data": [
+                {"bpm": 61, "source": "awake", "timestamp": "2024-01-01T00:05:00"}
+            ],
+            "next_token": None,
+        },
+    ]
+    responses = []
+    for page in pages:
+        response = MagicMock(status_code=200, reason="OK")
+        response.raw = io.BytesIO(json.dumps(page).encode())
+        responses.append(response)
+    mock_get.side_effect = responses
+
+    samples = list(client.iter_heartrate("2024-01-01", "2024-01-02"))
+
+    assert [s.bpm for s in samples] == [60, 61]
+    assert mock_get.call_args_list[1].kwargs["params"]["next_token"] == "tok"
+    assert all(r.close.called for r in responses)
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+@patch("requests.Session.request")
+def test_iter_sleep_summary(mock_request, client, prefetch):
+    pages = [
+        {"data": [SLEEP_DATUM], "next_token": "tok"},
+        {"data": [SLEEP_DATUM, SLEEP_DATUM], "next_token": None},
+    ]
+    responses = []
+    for page in pages:
+        response = MagicMock(status_code=200, reason="OK")
+        response.content = json.dumps(page).encode()
+        responses.append(response)
+    mock_request.side_effect = responses
+
+    data = list(
+        client.iter_sleep_summary("2024-01-01", "2024-01-31", prefetch=prefetch)
+    )
+
+    assert len(data) == 3
+    assert all(isinstance(d, SleepSummaryDatum) for d in data)
+    assert mock_request.call_args_list[1].kwargs["params"]["next_token"] == "tok"
+
+
+@patch("requests.Session.request")
+def test_get_summary(mock_request, client):
+    _ok(mock_request, {"data": [SLEEP_DATUM], "next_token": None})
+
+    assert isinstance(client.get_summary("sleep"), SleepSummary)
+    with pytest.raises(ValueError):
+        client.get_summary("daily_sleep")
+
+
+@patch("requests.Session.request")
+def test_get_all_sleep_summary(mock_request, client):
+    pages = [
+        {"data": [SLEEP_DATUM], "next_token": "tok"},
+        {"data": [SLEEP_DATUM], "next_token": None},
+    ]
+    responses = []
+    for page in pages:
+        response = MagicMock(status_code=200, reason="OK")
+        response.content = json.dumps(page).encode()
+        responses.append(response)
+    mock_request.side_effect = responses
+
+    summary = client.get_all_sleep_summary("2024-01-01", "2024-03-01")
+
+    assert isinstance(summary, SleepSummary)
+    assert summary.column("score") == [80, 80]
+    assert summary.next_token is None
@@ -0,0 +1,402 @@
+import json
+import pytest
+import requests
+from unittest.mock import patch
+from oura_py.helpers import RequestManager, TTLCache, TokenBucket, prep_dates
+from oura_py.exceptions import OuraPyException, OuraPyRateLimitError
+from oura_py.models import SleepSummary
+
+
+@pytest.fixture
+def manager():
+    return RequestManager(
+        personal_access_token="test_token",
+        hostname="api.example.com",
+        ver="v2",
+        path="usercollection",
+    )
+
+
+def test_session_headers(manager):
+    assert manager._session.headers["Authorization"] == "Bearer test_token"
+    assert manager._session.verify is True
+
+
+@patch("requests.Session.request")
+def test_get_success(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = json.dumps(
+        {"data": [], "next_token": None}
+    ).encode()
+
+    result = manager.get("daily_sleep", params={"start_date": "2024-01-01"})
+
+    mock_request.assert_called_once_with(
+        method="GET",
+        url="https://api.example.com/v2/usercollection/daily_sleep",
+        params={"start_date": "2024-01-01"},
+        data=None,
+        headers=None,
+        timeout=(5.0, 10.0),
+    )
+    assert result.status_code == 200
+    assert result.message == "OK"
+    assert result.data == {"data": [], "next_token": None}
+
+
+@patch("requests.Session.request")
+def test_get_error_status(mock_request, manager):
+    mock_request.return_value.status_code = 401
+    mock_request.return_value.reason = "Unauthorized"
+    mock_request.return_value.content = json.dumps({"detail": "Unauthorized"}).encode()
+
+    with pytest.raises(OuraPyException):
+        manager.get("daily_sleep")
+
+
+@patch("requests.Session.close")
+def test_close(mock_close, manager):
+    manager.close()
+    mock_close.assert_called_once()
+
+
+@patch("requests.Session.request")
+def test_get_typed(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = json.dumps(
+        {"data": [], "next_token": "abc"}
+    ).encode()
+
+    summary = manager.get_typed("daily_sleep", SleepSummary)
+
+    assert isinstance(summary, SleepSummary)
+    assert summary.data == []
+    assert summary.next_token == "abc"
+
+
+@patch("requests.Session.request")
+def test_get_is_cached(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = json.dumps({"id": "abc"}).encode()
+
+    first = manager.get("personal_info")
+    second = manager.get("personal_info")
+
+    mock_request.assert_called_once()
+    assert first.data == second.data == {"id": "abc"}
+
+    manager.clear_cache()
+    manager.get("personal_info")
+    assert mock_request.call_count == 2
+
+
+@patch("requests.Session.request")
+def test_get_with_list_params_is_cached(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = json.dumps({"id": "abc"}).encode()
+
+    manager.get("personal_info", params={"fields": ["a", "b"]})
+    manager.get("personal_info", params={"fields": ("a", "b")})
+    mock_request.assert_called_once()
+
+    manager.get("personal_info", params={"fields": {"a": 1}})
+    manager.get("personal_info", params={"fields": {"a": 1}})
+    assert mock_request.call_count == 3
+
+
+@patch("requests.Session.request")
+def test_cache_hits_do_not_share_data(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = json.dumps({"id": "abc"}).encode()
+
+    manager.get("personal_info").data["id"] = "mutated"
+    result = manager.get("personal_info")
+
+    assert mock_request.call_count == 1
+    assert result.data == {"id": "abc"}
+
+
+@patch("requests.Session.request")
+def test_summaries_are_not_cached(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = b'{"data": [], "next_token": null}'
+
+    manager.get("daily_sleep")
+    manager.get("daily_sleep")
+
+    assert mock_request.call_count == 2
+
+
+@patch("requests.Session.request")
+def test_cache_fallback(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = json.dumps({"id": "abc"}).encode()
+    manager._cache_fallback = True
+    manager.get("personal_info")
+
+    with patch("time.monotonic", return_value=float("inf")):
+        mock_request.side_effect = requests.exceptions.ConnectionError()
+        result = manager.get("personal_info")
+
+    assert result.data == {"id": "abc"}
+
+
+def test_ttl_cache_expiry_and_eviction():
+    cache = TTLCache(maxsize=2)
+    with patch("time.monotonic", return_value=0.0):
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2, ttl=10)
+        cache.set("c", 3, ttl=10)
+    with patch("time.monotonic", return_value=5.0):
+        assert cache.get("a") is None
+        assert cache.get("c") == 3
+    with patch("time.monotonic", return_value=20.0):
+        assert cache.get("c") is None
+        assert cache.get("c", stale=True) == 3
+
+
+def test_token_bucket_spaces_requests():
+    with patch("time.monotonic", return_value=0.0):
+        bucket = TokenBucket(rate=60)
+        assert all(bucket.reserve() == 0.0 for _ in range(60))
+        assert bucket.reserve() == pytest.approx(1.0)
+        assert bucket.reserve() == pytest.approx(2.0)
+    with patch("time.monotonic", return_value=10.0):
+        assert bucket.reserve() == 0.0
+
+
+@patch("time.sleep")
+@patch("requests.Session.request")
+def test_rate_limit_throttles_network_requests(mock_request, mock_sleep):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = json.dumps({"id": "abc"}).encode()
+    with patch("time.monotonic", return_value=0.0):
+        manager = RequestManager(
+            personal_access_token="test_token",
+            hostname="api.example.com",
+            ver="v2",
+            path="usercollection",
+            rate_limit=1,
+        )
+        manager.get("personal_info")
+        manager.get("personal_info")
+        mock_sleep.assert_not_called()
+        manager.get("personal_info", params={"fields": "age"})
+
+    mock_sleep.assert_called_once_with(pytest.approx(60.0))
+
+
+@patch("time.sleep")
+def test_rate_limit_counts_retries(mock_sleep):
+    manager = RequestManager(
+        personal_access_token="test_token",
+        hostname="api.example.com",
+        ver="v2",
+        path="usercollection",
+        rate_limit=60,
+    )
+    retry = manager._session.get_adapter("https://api.example.com").max_retries
+    retry = retry.new(total=retry.total - 1)
+
+    with patch.object(manager._bucket, "acquire") as acquire:
+        retry.sleep()
+
+    acquire.assert_called_once_with()
+
+
+@patch("requests.Session.request")
+def test_bad_json(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = b"<html>"
+
+    with pytest.raises(OuraPyException, match="Bad JSON"):
+        manager.get("daily_sleep")
+
+
+def test_prep_dates():
+    assert prep_dates("2024-01-01", "2024-01-31") == ("2024-01-01", "2024-01-31")
+    assert prep_dates(end_date="2024-03-01") == ("2024-02-29", "2024-03-01")
+    assert prep_dates("20240101", "2024-01-02") == ("2024-01-01", "2024-01-02")
+    with pytest.raises(OuraPyException):
+        prep_dates("2024-02-01", "2024-01-31")
+    with pytest.raises(OuraPyException, match="end_date"):
+        prep_dates("2024-01-01", "2024-13-45")
+    with pytest.raises(OuraPyException, match="start_date"):
+        prep_dates(20240101, "2024-01-02")
+    with pytest.raises(OuraPyException, match="start_date"):
+        prep_dates(["2024-01-01"], "2024-01-02")
+
+
+@patch("urllib3.disable_warnings")
+def test_insecure_warning_disabled_once(mock_disable):
+    with patch("oura_py.helpers._insecure_warnings_disabled", False):
+        for _ in range(2):
+            RequestManager(
+                personal_access_token="test_token",
+                hostname="api.example.com",
+                ver="v2",
+                path="usercollection",
+                ssl_verify=False,
+            )
+
+    mock_disable.assert_called_once()
+
+
+def test_accept_encoding(manager):
+    assert "gzip" in manager._session.headers["Accept-Encoding"]
+
+
+@patch("requests.Session.request")
+def test_rate_limited(mock_request, manager):
+    mock_request.return_value.status_code = 429
+    mock_request.return_value.reason = "Too Many Requests"
+    mock_request.return_value.headers = {"Retry-After": "30"}
+
+    with pytest.raises(OuraPyRateLimitError) as excinfo:
+        manager.get("daily_sleep")
+
+    assert excinfo.value.retry_after == 30.0
+    mock_request.return_value.json.assert_not_called()
+
+
+def test_retry_adapter(manager):
+    retry = manager._session.get_adapter("https://api.example.com").max_retries
+    assert retry.total == 3
+    assert 503 in retry.status_forcelist
+    assert retry.allowed_methods == ("GET",)
+    assert retry.raise_on_status is False
+
+
+@patch("requests.Session.request")
+def test_cache_modes(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = b'{"id": "abc"}'
+    manager.get("personal_info")
+
+    manager._cache_mode = "replay"
+    assert manager.get("personal_info").data == {"id": "abc"}
+    with pytest.raises(OuraPyException, match="replay"):
+        manager.get("ring_configuration")
+    assert mock_request.call_count == 1
+
+    manager._cache_mode = "disabled"
+    manager.get("personal_info")
+    assert mock_request.call_count == 2
+
+    manager._cache_mode = "enabled"
+    manager._cache_ttl = 0
+    manager.clear_cache()
+    manager.get("personal_info")
+    manager.get("personal_info")
+    assert mock_request.call_count == 4
+
+
+@patch("requests.Session.get")
+@patch("requests.Session.request")
+def test_replay_mode_never_touches_network(mock_request, mock_get, manager):
+    manager._cache_mode = "replay"
+
+    with pytest.raises(OuraPyException, match="replay"):
+        manager.get("personal_info", raw=True)
+    with pytest.raises(OuraPyException, match="replay"):
+        manager.post("tag", data={"text": "x"})
+    with pytest.raises(OuraPyException, match="replay"):
+        manager.stream_get("heartrate")
+
+    mock_request.assert_not_called()
+    mock_get.assert_not_called()
+
+
+@patch("requests.Session.request")
+def test_read_only_post_keeps_cache(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = b"{}"
+    manager.get("ring_configuration")
+
+    manager._cache_mode = "read-only"
+    manager.post("ring_configuration/abc", data={"text": "x"})
+    manager.get("ring_configuration")
+
+    assert mock_request.call_count == 2
+
+
+@patch("requests.Session.request")
+def test_post_invalidates_resource(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = b"{}"
+    manager.get("ring_configuration")
+    manager.get("personal_info")
+
+    manager.post("ring_configuration/abc", data={"text": "x"})
+    manager.get("ring_configuration")
+    manager.get("personal_info")
+
+    assert mock_request.call_count == 4
+
+
+@patch("requests.Session.request")
+def test_post_invalidates_without_json_body(mock_request, manager):
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.reason = "OK"
+    mock_request.return_value.content = b"{}"
+    manager.get("personal_info")
+
+    manager.post("personal_info", data={}, raw=True)
+    manager.get("personal_info")
+    assert mock_request.call_count == 3
+
+    mock_request.return_value.status_code = 204
+    mock_request.return_value.content = b""
+    with pytest.raises(OuraPyException):
+        manager.post("personal_info", data={})
+    mock_request.return_value.status_code = 200
+    mock_request.return_value.content = b"{}"
+    manager.get("personal_info")
+    assert mock_request.call_count == 5
+
+
+@pytest.mark.parametrize(
+    "data, body",
+    [
+        ({"url": "https://example.com/hook"}, b'{"url":"https://example.com/hook"}'),
+        (b'{"a":1}', b'{"a":1}'),
+        ('{"a":"é"}', '{"a":"é"}'.encode()),
+        (memoryview(bytearray(b'{"a":1}')), b'{"a":1}'),
+    ],
+)
+@patch("requests.Session.request")
+def test_post_sends_json_body(mock_request, manager, data, body):
+    mock_request.return_value.status_code = 201
+    mock_request.return_value.reason = "Created"
+    mock_request.return_value.content = b"{}"
+
+    manager.post("webhook/subscription", data=data)
+
+    assert mock_request.call_args.kwargs["data"] == body
+    assert mock_request.call_args.kwargs["headers"] == {
+        "Content-Type": "application/json"
+    }
+
+
+@patch("requests.Session.request")
+def test_post_unserializable_body(mock_request, manager):
+    with pytest.raises(OuraPyException, match="JSON serializable"):
+        manager.post("webhook/subscription", data={"at": object()})
+    mock_request.assert_not_called()
+
+
+def test_invalid_cache_mode():
+    with pytest.raises(ValueError):
+        RequestManager("test_token", "api.example.com", "v2", "x", cache_mode="on")